@@ -0,0 +1,64 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create faculty profiles records attribution table."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+from sqlalchemy_utils import UUIDType
+
+# revision identifiers, used by Alembic.
+revision = "4d5f8e2b1c3a"
+down_revision = "fb0de62682b0"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "faculty_profiles_records",
+        sa.Column(
+            "created",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.Column("profile_id", UUIDType(), nullable=False),
+        sa.Column("record_id", sa.String(length=255), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["profile_id"],
+            ["faculty_profiles_metadata.id"],
+            name=op.f(
+                "fk_faculty_profiles_records_profile_id_faculty_profiles_metadata"
+            ),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "profile_id", "record_id", name=op.f("pk_faculty_profiles_records")
+        ),
+    )
+    op.create_index(
+        op.f("ix_faculty_profiles_records_record_id"),
+        "faculty_profiles_records",
+        ["record_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_faculty_profiles_records_record_id"),
+        table_name="faculty_profiles_records",
+    )
+    op.drop_table("faculty_profiles_records")
@@ -0,0 +1,34 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Add an index on the update time of faculty profiles."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c1e7a4b2d6f"
+down_revision = "4d5f8e2b1c3a"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "ix_faculty_profiles_metadata_updated_id",
+        "faculty_profiles_metadata",
+        ["updated", "id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        "ix_faculty_profiles_metadata_updated_id",
+        table_name="faculty_profiles_metadata",
+    )
@@ -67,7 +67,7 @@ class FacultyProfileCard extends Component {
           wrapped
           centered
           ui={false}
-          src={links.photo}
+          src={links.photo_large}
           fallbackSrc={defaultPhoto}
           loadFallbackFirst
         />
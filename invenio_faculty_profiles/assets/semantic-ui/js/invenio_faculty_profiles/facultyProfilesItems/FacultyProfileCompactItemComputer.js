@@ -30,7 +30,7 @@ export const FacultyProfileCompactItemComputer = ({
         <Image
           wrapped
           size="tiny"
-          src={links.photo}
+          src={links.photo_medium}
           alt=""
           className="community-image rel-mr-2"
         />
@@ -27,7 +27,7 @@ export const FacultyProfileCompactItemMobile = ({
           <Image
             wrapped
             size="mini"
-            src={links.photo}
+            src={links.photo_medium}
             alt=""
             className="community-image rel-mr-1"
           />
@@ -22,7 +22,7 @@ export const FacultyProfileItemComputer = ({ result }) => {
         <div className="flex align-items-center">
           <Image
             wrapped
-            src={links.photo}
+            src={links.photo_medium}
             size="tiny"
             className="community-image rel-mr-2"
             alt=""
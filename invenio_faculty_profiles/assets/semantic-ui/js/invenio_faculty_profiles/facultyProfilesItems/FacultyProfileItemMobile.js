@@ -22,7 +22,7 @@ export const FacultyProfileItemMobile = ({ result, index }) => {
           <div className="flex align-items-center">
             <Image
               wrapped
-              src={links.photo}
+              src={links.photo_medium}
               size="mini"
               className="community-image rel-mr-1"
               alt=""
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Command-line tools for faculty profiles."""
+
+import time
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from invenio_access.permissions import system_identity
+from invenio_db import db
+
+from .export import EXPORT_FORMATS, serialize_export
+from .proxies import current_profiles_service
+from .reindex import reindex as reindex_profiles
+from .tasks import process_index_queue, update_records_attribution
+from .utils import iter_json_entries
+
+
+@click.group()
+def faculty_profiles():
+    """Invenio faculty profiles commands."""
+
+
+@faculty_profiles.command("import")
+@click.argument("source", type=click.File("r", encoding="utf-8"))
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    help="Number of profiles created per transaction.",
+)
+@click.option(
+    "--index/--no-index",
+    default=True,
+    help="Process the bulk indexing queue once the import is finished.",
+)
+@with_appcontext
+def import_profiles(source, chunk_size, index):
+    """Import faculty profiles from a JSON array or JSON lines file."""
+    click.secho("Importing faculty profiles...", fg="green")
+
+    created = failed = 0
+    results = current_profiles_service.import_many(
+        system_identity, iter_json_entries(source), chunk_size=chunk_size
+    )
+    for result in results:
+        if result["errors"]:
+            failed += 1
+            click.secho(f"Row {result['row']}: {result['errors']}", fg="red")
+        else:
+            created += 1
+
+    if index:
+        click.secho("Indexing faculty profiles...", fg="green")
+        current_profiles_service.indexer.process_bulk_queue()
+
+    click.secho(f"Created {created} faculty profiles, {failed} failed.", fg="green")
+
+
+@faculty_profiles.command("export")
+@click.argument(
+    "output", type=click.File("w", encoding="utf-8", lazy=True), default="-"
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(list(EXPORT_FORMATS)),
+    default="jsonl",
+    help="Format of the export.",
+)
+@click.option(
+    "--updated-since",
+    type=click.DateTime(),
+    help="Only export the profiles updated since then, in UTC.",
+)
+@with_appcontext
+def export_profiles(output, export_format, updated_since):
+    """Export faculty profiles as JSON lines or CSV."""
+    profiles = current_profiles_service.export(
+        system_identity, updated_since=updated_since
+    )
+    lines = serialize_export(
+        profiles,
+        export_format,
+        current_app.config["FACULTY_PROFILES_EXPORT_CSV_COLUMNS"],
+    )
+    for line in lines:
+        output.write(line)
+
+
+@faculty_profiles.command("attribute-records")
+@with_appcontext
+def attribute_records():
+    """Recompute the records attributed to every faculty profile."""
+    click.secho("Attributing records to faculty profiles...", fg="green")
+
+    model_cls = current_profiles_service.record_cls.model_cls
+    profiles = (
+        db.session.query(model_cls.id)
+        .filter(model_cls.is_deleted == False)  # noqa: E712
+        .yield_per(1000)
+    )
+    for profile in profiles:
+        update_records_attribution.delay(str(profile.id))
+
+    click.secho("Queued records attribution of faculty profiles!", fg="green")
+
+
+@faculty_profiles.command("reindex")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of threads dumping and indexing the profiles.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    help="Number of profiles sent per bulk request.",
+)
+@click.option(
+    "--delete-old/--keep-old",
+    default=True,
+    help="Delete the previous index once the aliases point to the new one.",
+)
+@with_appcontext
+def reindex(workers, batch_size, delete_old):
+    """Reindex faculty profiles into a new index and swap the aliases to it."""
+    click.secho("Reindexing faculty profiles...", fg="green")
+
+    new_index, indexed, failed = reindex_profiles(
+        workers or current_app.config["FACULTY_PROFILES_REINDEX_WORKERS"],
+        batch_size or current_app.config["FACULTY_PROFILES_REINDEX_BATCH_SIZE"],
+        delete_old=delete_old,
+    )
+
+    click.secho(
+        f"Indexed {indexed} faculty profiles into {new_index}, {failed} failed.",
+        fg="red" if failed else "green",
+    )
+
+
+@faculty_profiles.command("index-queue")
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0),
+    help="Time, in seconds, between two runs; updates made meanwhile are coalesced.",
+)
+@click.option("--once", is_flag=True, help="Process the queue once and exit.")
+@with_appcontext
+def index_queue(interval, once):
+    """Process the faculty profiles indexing queue."""
+    if interval is None:
+        interval = current_app.config["FACULTY_PROFILES_INDEXER_WINDOW"]
+
+    while True:
+        indexed, failed = process_index_queue()
+        if indexed or failed:
+            click.secho(
+                f"Indexed {indexed} faculty profiles, {failed} failed.",
+                fg="red" if failed else "green",
+            )
+        if once:
+            return
+        time.sleep(interval)
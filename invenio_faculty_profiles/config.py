@@ -74,10 +74,237 @@ FACULTY_PROFILES_SEARCH = {
 """Faculty Profile search configuration."""
 
 
+FACULTY_PROFILES_SEARCH_TIMEOUT = "2s"
+"""Time after which a search returns the hits found so far, ``None`` to wait."""
+
+
+FACULTY_PROFILES_SEARCH_CACHE_TIMEOUT = None
+"""Time, in seconds, the search responses are cached, e.g. 5.
+
+Identical searches, with the same parameters and permission filter, share a
+response from the Invenio cache, e.g. Redis, dropped when profiles are
+committed or indexed. Set to ``None`` to disable the cache.
+"""
+
+
+FACULTY_PROFILES_SEARCH_CACHE_LOCK_TIMEOUT = 5
+"""Time, in seconds, searches wait for an identical search being executed."""
+
+
+FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL = 1
+"""Time, in seconds, indexed profiles take to be searchable.
+
+The refresh interval of the search index: for this long after being
+dropped, search responses are only cached until its end.
+"""
+
+
+FACULTY_PROFILES_QUERY_MAX_LENGTH = 1000
+"""Maximum length, in characters, of a search query string."""
+
+
+FACULTY_PROFILES_QUERY_MAX_CLAUSES = 64
+"""Maximum number of terms, phrases and ranges of a search query string."""
+
+
+FACULTY_PROFILES_QUERY_MAX_EXPANSIONS = 8
+"""Maximum number of wildcard and fuzzy terms of a search query string."""
+
+
+FACULTY_PROFILES_QUERY_WILDCARD_FIELDS = {
+    "metadata.family_name": "metadata.family_name.suggest",
+    "metadata.given_names": "metadata.given_names.suggest",
+    "metadata.department": "metadata.department.suggest",
+    "metadata.institution": "metadata.institution.suggest",
+}
+"""Fields whose wildcard terms are searched on a prefix-indexed subfield."""
+
+
+FACULTY_PROFILES_SUGGEST_SIZE = 10
+"""Default number of faculty profiles suggested for a search-as-you-type query."""
+
+
+FACULTY_PROFILES_SUGGEST_FIELDS = [
+    "metadata.family_name.suggest^3",
+    "metadata.given_names.suggest^2",
+    "metadata.department.suggest",
+    "metadata.institution.suggest",
+]
+"""Name fields matched by suggestions, with their boosts.
+
+The ``search_as_you_type`` subfields of the mapping are matched as prefixes,
+their shingle subfields are added to the query.
+"""
+
+
+FACULTY_PROFILES_SCAN_PAGE_SIZE = 500
+"""Number of faculty profiles fetched per search request by the scan endpoint."""
+
+
+FACULTY_PROFILES_SCAN_KEEP_ALIVE = "1m"
+"""Time the point in time of a scan is kept open between two pages."""
+
+
+FACULTY_PROFILES_EXPORT_BATCH_SIZE = 500
+"""Number of faculty profiles read from the database at once by exports."""
+
+
+FACULTY_PROFILES_EXPORT_CSV_COLUMNS = [
+    "id",
+    "created",
+    "updated",
+    "active",
+    "metadata.given_names",
+    "metadata.family_name",
+    "metadata.preferred_pronouns",
+    "metadata.title_status",
+    "metadata.department",
+    "metadata.institution",
+    "metadata.email_address",
+    "metadata.contact_email_address",
+    "metadata.telephone_e164",
+    "metadata.website",
+    "metadata.identifiers",
+]
+"""Columns of the CSV exports, as dotted paths in the serialized profiles.
+
+Lists and objects, e.g. ``metadata.identifiers``, are written as JSON.
+"""
+
+
+FACULTY_PROFILES_CHANGES_PAGE_SIZE = 100
+"""Default number of changes returned per page of the change feed."""
+
+
+FACULTY_PROFILES_CHANGES_DELAY = 5
+"""Time, in seconds, recent changes are held back from the change feed.
+
+Rows are timestamped when flushed, not when committed: the delay must exceed
+the duration of the longest transaction updating profiles, or a change could
+be committed behind a token already handed out.
+"""
+
+
+FACULTY_PROFILES_ASYNC_INDEXING = False
+"""Queue the faculty profiles for indexing instead of indexing them at once.
+
+The queue is processed by the ``faculty-profiles index-queue`` command, or by
+scheduling the ``process_index_queue`` task, e.g.:
+
+.. code-block:: python
+
+    CELERY_BEAT_SCHEDULE = {
+        "faculty-profiles-index-queue": {
+            "task": "invenio_faculty_profiles.tasks.process_index_queue",
+            "schedule": timedelta(seconds=10),
+        },
+    }
+
+The updates of a profile made between two runs are indexed once.
+"""
+
+
+FACULTY_PROFILES_INDEXER_WINDOW = 10
+"""Time, in seconds, between two runs of the ``index-queue`` command."""
+
+
+FACULTY_PROFILES_INDEXER_BATCH_SIZE = 1000
+"""Maximum number of queued messages processed per bulk request."""
+
+
+FACULTY_PROFILES_PAGE_CACHE_TIMEOUT = None
+"""Time, in seconds, the profile pages rendered for anonymous users are cached.
+
+Pages are stored in the Invenio cache, e.g. Redis, and dropped when the profile
+or its files change. Set to ``None`` to disable the cache.
+"""
+
+
+FACULTY_PROFILES_TELEPHONE_REGION = None
+"""Region of the phone numbers written without a country code, e.g. ``US``.
+
+When not set, the territory of the request locale is used, then ``US``.
+"""
+
+
 FACULTY_PROFILES_PHOTO_MAX_FILE_SIZE = 10**6
 """Faculty Profile image photo size quota, in bytes."""
 
 
+FACULTY_PROFILES_PHOTO_RENDITION_SIZES = [64, 128, 512]
+"""Sizes, in pixels, of the boxes the photo renditions are resized to fit.
+
+Renditions are made with Pillow, from the ``images`` extra. Without it, the
+original photo is served for every size.
+"""
+
+
+FACULTY_PROFILES_PHOTO_RENDITION_FORMAT = "WEBP"
+"""Image format of the photo renditions, ``WEBP`` or ``JPEG``."""
+
+
+FACULTY_PROFILES_FILES_TRANSFER_TYPES = ["M"]
+"""Transfer types allowed to upload photos and CVs without streaming them.
+
+``M`` for multipart uploads, sent to the storage directly when it provides
+presigned part URLs, e.g. with Invenio-S3. ``F`` for files fetched from a URL
+and ``R`` for remote files, whose downloads redirect to their URL; their
+domains must be allowed by ``RECORDS_RESOURCES_FILES_ALLOWED_DOMAINS`` and
+``RECORDS_RESOURCES_FILES_ALLOWED_REMOTE_DOMAINS``.
+"""
+
+
+FACULTY_PROFILES_FILES_MAX_AGE = 3600
+"""Time, in seconds, browsers and proxies may cache photo and CV downloads.
+
+Set to ``None`` to make them revalidate every download with the ETag.
+"""
+
+
+FACULTY_PROFILES_CV_MAX_FILE_SIZE = 10 * 10**6
+"""Faculty Profile CV size quota, in bytes."""
+
+
+FACULTY_PROFILES_UPLOAD_CHUNK_SIZE = 2**16
+"""Size of the chunks in which uploaded files are copied to storage, in bytes."""
+
+
+FACULTY_PROFILES_RECORDS_ATTRIBUTION_ENABLED = False
+"""Filter the records of a faculty profile with the precomputed attribution.
+
+When enabled, the records tab of a profile uses the records attributed to it
+in the ``faculty_profiles_records`` table instead of matching the creators
+names and identifiers at query time. Attribution is kept current when a
+profile's name or identifiers change, and when records are published if
+``FacultyProfilesRecordComponent`` is added to
+``RDM_RECORDS_SERVICE_COMPONENTS``. Existing data is attributed with
+``invenio faculty-profiles attribute-records``.
+"""
+
+FACULTY_PROFILES_READ_MANY_MAX_IDS = 100
+"""Maximum number of faculty profiles read at once by their ids."""
+
+
+FACULTY_PROFILES_IMPORT_CHUNK_SIZE = 500
+"""Number of faculty profiles created per transaction by the bulk import."""
+
+
+FACULTY_PROFILES_REINDEX_BATCH_SIZE = 500
+"""Number of faculty profiles sent per bulk request by the reindex command."""
+
+
+FACULTY_PROFILES_REINDEX_WORKERS = 4
+"""Number of threads dumping and indexing faculty profiles on reindex."""
+
+
+FACULTY_PROFILES_TYPES_CACHE_TTL = 3600
+"""Seconds the profile types shown in the new and edit forms are cached.
+
+The cache is process-local and cleared when the profile types vocabulary
+changes.
+"""
+
+
 FACULTY_PROFILES_ERROR_HANDLERS = {
     **faculty_profile_error_handlers,
 }
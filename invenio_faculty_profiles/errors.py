@@ -17,15 +17,28 @@ class FacultyProfileError(Exception):
     """Base exception for faculty profile errors."""
 
 
-class PhotoSizeLimitError(FacultyProfileError):
-    """The provided logo size exceeds limit."""
+class FileSizeLimitError(FacultyProfileError):
+    """The provided file size exceeds limit."""
+
+    label = "File"
 
-    def __init__(self, limit, file_size):
+    def __init__(self, limit, file_size=None):
         """Initialise error."""
-        super().__init__(
-            _(
-                "Picture size limit exceeded. Limit: {limit} bytes Given: {file_size} bytes".format(
-                    limit=ceil(limit), file_size=ceil(file_size)
-                )
-            )
+        message = "{label} size limit exceeded. Limit: {limit} bytes".format(
+            label=self.label, limit=ceil(limit)
         )
+        if file_size is not None:
+            message += " Given: {file_size} bytes".format(file_size=ceil(file_size))
+        super().__init__(_(message))
+
+
+class PhotoSizeLimitError(FileSizeLimitError):
+    """The provided logo size exceeds limit."""
+
+    label = "Picture"
+
+
+class CVSizeLimitError(FileSizeLimitError):
+    """The provided CV size exceeds limit."""
+
+    label = "CV"
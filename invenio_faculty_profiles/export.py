@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Serialization of faculty profile exports."""
+
+import csv
+import json
+from io import StringIO
+
+
+def iter_jsonl(profiles):
+    """Yield the serialized faculty profiles as JSON lines."""
+    for profile in profiles:
+        yield json.dumps(profile, ensure_ascii=False) + "\n"
+
+
+def get_column(profile, column):
+    """Get the value of a dotted ``column`` path in a serialized profile.
+
+    Lists and objects are written as JSON, missing values as empty strings.
+    """
+    value = profile
+    for key in column.split("."):
+        if not isinstance(value, dict):
+            return ""
+        value = value.get(key)
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def iter_csv(profiles, columns):
+    """Yield the serialized faculty profiles as CSV lines, header first."""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    writer.writerow(columns)
+    yield flush()
+    for profile in profiles:
+        writer.writerow([get_column(profile, column) for column in columns])
+        yield flush()
+
+
+EXPORT_FORMATS = {
+    "jsonl": "application/x-ndjson",
+    "csv": "text/csv",
+}
+"""Export formats and their media types."""
+
+
+def serialize_export(profiles, export_format, columns):
+    """Serialize the faculty profiles of an export, line by line."""
+    if export_format == "csv":
+        return iter_csv(profiles, columns)
+    return iter_jsonl(profiles)
@@ -10,19 +10,31 @@
 
 from functools import cached_property
 
-from flask import g
+from flask import current_app, g
 from flask_menu import current_menu
+from invenio_cache import current_cache
+from invenio_db import db
 from invenio_i18n import lazy_gettext as _
+from invenio_records.signals import (
+    after_record_delete,
+    after_record_insert,
+    after_record_update,
+)
 from invenio_records_resources.services import FileService
+from invenio_vocabularies.records.api import Vocabulary
+from sqlalchemy import event
 
 from . import config
 from .proxies import current_profiles
+from .records.api import FacultyProfile, clear_resolver_cache
 from .resources import FacultyProfileResource, FacultyProfileResourceConfig
 from .services import (
     FacultyProfileFileServiceConfig,
     FacultyProfileService,
     FacultyProfileServiceConfig,
 )
+from .services.cache import invalidate_search_results
+from .utils import TTLCache, profile_page_version_key
 
 
 class FacultyProfileExtension:
@@ -41,6 +53,7 @@ class FacultyProfileExtension:
         self.init_config(app)
         self.init_services()
         self.init_resource()
+        self.init_caches()
         app.extensions["invenio-faculty-profiles"] = self
 
     def init_services(self):
@@ -57,6 +70,23 @@ class FacultyProfileExtension:
             service=self.records_service,
         )
 
+    def init_caches(self):
+        """Initialize process-local and request-scoped caches."""
+        self.profile_types_cache = TTLCache()
+        self.search_app_configs = {}
+        # Module level receivers, connected once whatever the number of apps
+        for signal in (after_record_insert, after_record_update, after_record_delete):
+            signal.connect(clear_profile_types_cache)
+            signal.connect(track_profile_change)
+        for identifier, listener in (
+            ("after_commit", clear_resolver_cache),
+            ("after_soft_rollback", clear_resolver_cache),
+            ("after_commit", invalidate_profile_caches),
+            ("after_soft_rollback", discard_profile_changes),
+        ):
+            if not event.contains(db.session, identifier, listener):
+                event.listen(db.session, identifier, listener)
+
     #     # region Private Methods
 
     @cached_property
@@ -86,6 +116,38 @@ class FacultyProfileExtension:
                 app.config.setdefault(k, getattr(config, k))
 
 
+def clear_profile_types_cache(sender, record=None, **kwargs):
+    """Invalidate the profile types cache when the vocabulary changes."""
+    if not isinstance(record, Vocabulary):
+        return
+    extension = current_app.extensions.get("invenio-faculty-profiles")
+    if extension and record.get("type", {}).get("id") == "profiletypes":
+        extension.profile_types_cache.clear()
+
+
+def track_profile_change(sender, record=None, **kwargs):
+    """Remember the profiles changed in the transaction, for the caches."""
+    if isinstance(record, FacultyProfile):
+        changed = db.session.info.setdefault("faculty_profiles_changed", set())
+        changed.add(str(record.id))
+
+
+def invalidate_profile_caches(session):
+    """Drop the cached pages and searches of the profiles changed by a commit."""
+    changed = session.info.pop("faculty_profiles_changed", None)
+    if not changed:
+        return
+    if current_app.config["FACULTY_PROFILES_PAGE_CACHE_TIMEOUT"]:
+        current_cache.delete_many(*(profile_page_version_key(id_) for id_ in changed))
+    invalidate_search_results()
+
+
+def discard_profile_changes(session, previous_transaction):
+    """Forget the profiles changed by a transaction which was rolled back."""
+    if not previous_transaction.nested:
+        session.info.pop("faculty_profiles_changed", None)
+
+
 def finalize_app(app):
     """Finalize app.
 
@@ -148,6 +210,9 @@ def init(app):
     # register service
     sregistry = app.extensions["invenio-records-resources"].registry
     sregistry.register(ext.records_service, service_id=service_id)
+    # Fetched files are committed by a task, which looks the files service up
+    files_service = ext.records_service.files
+    sregistry.register(files_service, service_id=files_service.config.service_id)
     # Register indexers
     iregistry = app.extensions["invenio-indexer"].registry
     iregistry.register(ext.records_service.indexer, indexer_id=service_id)
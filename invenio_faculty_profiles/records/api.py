@@ -8,6 +8,9 @@
 
 """Records API."""
 
+from collections import Counter
+
+from flask import g, has_app_context, has_request_context
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_records.dumpers import SearchDumper
 from invenio_records.dumpers.indexedat import IndexedAtDumperExt
@@ -22,9 +25,23 @@ from sqlalchemy.exc import NoResultFound, StatementError
 
 from .models import FacultyProfileFileModel, FacultyProfileModel
 
+resolver_cache_stats = Counter()
+"""Hits and misses of the request-scoped record cache, for this process."""
+
+
+def clear_resolver_cache(*args, **kwargs):
+    """Forget the records resolved so far, e.g. when the session commits."""
+    if has_app_context():
+        g.pop("faculty_profiles_records", None)
+
 
 class GetRecordResolver(object):
-    """Resolver that simply uses get record."""
+    """Resolver that simply uses get record.
+
+    Within a request, the resolved records are kept until the database session
+    commits or rolls back, so that resolving a record again returns the same
+    instance without querying the database.
+    """
 
     def __init__(self, record_cls):
         """Initialize resolver."""
@@ -33,6 +50,20 @@ class GetRecordResolver(object):
     def resolve(self, pid_value, registered_only=False):
         """Simply get the record."""
         _ = registered_only
+        if not has_request_context():
+            return self._get_record(pid_value)
+
+        records = g.setdefault("faculty_profiles_records", {})
+        key = (self._record_cls, str(pid_value))
+        if key in records:
+            resolver_cache_stats["hits"] += 1
+            return records[key]
+        resolver_cache_stats["misses"] += 1
+        records[key] = self._get_record(pid_value)
+        return records[key]
+
+    def _get_record(self, pid_value):
+        """Get the record from the database."""
         try:
             return self._record_cls.get_record(pid_value)
         except (NoResultFound, StatementError):
@@ -61,6 +92,68 @@ class DirectIdPID(SystemField):
         return self.obj(record)
 
 
+class FileSlots:
+    """Named file slots of a record, mapped to the key of the file they hold.
+
+    The mapping is stored in the record's JSON. Records created before the
+    slots were introduced have no mapping, for them the slots are found from
+    the file keys, named ``<slot>.<extension>``.
+    """
+
+    def __init__(self, record, key, names):
+        """Constructor."""
+        self._record = record
+        self._key = key
+        self.names = names
+
+    def _mapping(self):
+        """Get the stored mapping, building it for records without one."""
+        mapping = self._record.get(self._key)
+        if mapping is None:
+            mapping = {}
+            for file_key in self._record.files.keys():
+                name = file_key.split(".", 1)[0]
+                if name in self.names and "." in file_key:
+                    mapping.setdefault(name, file_key)
+        return mapping
+
+    def get(self, name):
+        """Get the file key held by a slot, or ``None`` if it is empty."""
+        return self._mapping().get(name)
+
+    def set(self, name, file_key):
+        """Set the file key held by a slot."""
+        if name not in self.names:
+            raise KeyError(name)
+        self._record[self._key] = {**self._mapping(), name: file_key}
+
+    def pop(self, name):
+        """Empty a slot, returning the file key it held."""
+        mapping = self._mapping()
+        file_key = mapping.pop(name, None)
+        self._record[self._key] = mapping
+        return file_key
+
+    def to_dict(self):
+        """Get the mapping of the filled slots to their file keys."""
+        return dict(self._mapping())
+
+
+class FileSlotsField(SystemField):
+    """System field giving access to the named file slots of a record."""
+
+    def __init__(self, key="attachments", names=None):
+        """Constructor."""
+        super().__init__(key=key)
+        self._names = tuple(names or ())
+
+    def __get__(self, record, owner=None):
+        """Get the file slots of the record."""
+        if record is None:
+            return self
+        return FileSlots(record, self.key, self._names)
+
+
 class FacultyProfileFile(FileRecord):
     """Faculty profile file API."""
 
@@ -101,5 +194,7 @@ class FacultyProfile(Record):
     bucket_id = ModelField(dump=False)
     bucket = ModelField(dump=False)
 
+    attachments = FileSlotsField("attachments", names=["photo", "cv"])
+
 
 FacultyProfileFile.record_cls = FacultyProfile
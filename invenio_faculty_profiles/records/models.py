@@ -19,6 +19,10 @@ class FacultyProfileModel(db.Model, RecordMetadataBase):
     """Faculty profile."""
 
     __tablename__ = "faculty_profiles_metadata"
+    __table_args__ = (
+        # Change feed, paginated on (updated, id)
+        db.Index("ix_faculty_profiles_metadata_updated_id", "updated", "id"),
+    )
 
     # kept here for easy searching
     active = db.Column(db.Boolean(name="active"))
@@ -33,3 +37,19 @@ class FacultyProfileFileModel(db.Model, RecordMetadataBase, FileRecordModelMixin
 
     __record_model_cls__ = FacultyProfileModel
     __tablename__ = "faculty_profiles_files"
+
+
+class FacultyProfileRecordModel(db.Model, db.Timestamp):
+    """Record attributed to a profile."""
+
+    __tablename__ = "faculty_profiles_records"
+
+    profile_id = db.Column(
+        UUIDType,
+        db.ForeignKey(FacultyProfileModel.id, ondelete="CASCADE"),
+        primary_key=True,
+    )
+    """Id of the faculty profile."""
+
+    record_id = db.Column(db.String(255), primary_key=True, index=True)
+    """PID value of the attributed record."""
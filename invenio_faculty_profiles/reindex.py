@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Reindexing of faculty profiles into a new index."""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+
+from flask import current_app
+from invenio_db import db
+from invenio_search import current_search, current_search_client
+from invenio_search.engine import search
+from invenio_search.utils import build_alias_name, timestamp_suffix
+
+from .records.api import FacultyProfile
+
+
+def iter_id_batches(batch_size, updated_since=None):
+    """Yield the ids of the faculty profiles, in batches of ``batch_size``.
+
+    The rows are paginated on their primary key, so that every batch is an
+    index range scan whatever the number of profiles. Deleted profiles are
+    only included when ``updated_since`` is given.
+    """
+    model_cls = FacultyProfile.model_cls
+    query = db.session.query(model_cls.id)
+    if updated_since is None:
+        query = query.filter(model_cls.is_deleted == False)  # noqa: E712
+    else:
+        query = query.filter(model_cls.updated >= updated_since)
+
+    last_id = None
+    while True:
+        batch_query = query
+        if last_id is not None:
+            batch_query = batch_query.filter(model_cls.id > last_id)
+        ids = [row.id for row in batch_query.order_by(model_cls.id).limit(batch_size)]
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def index_batch(app, index, ids):
+    """Index the faculty profiles of ``ids`` into ``index``.
+
+    Meant to run in a worker thread, with its own application context and
+    database session. Deleted profiles are removed from the index. Returns
+    the number of successful and failed actions.
+    """
+    with app.app_context():
+        actions = []
+        for record in FacultyProfile.get_records(ids, with_deleted=True):
+            action = {
+                "_index": index,
+                "_id": str(record.id),
+                "_version": record.revision_id,
+                "_version_type": "external_gte",
+            }
+            if record.is_deleted:
+                action["_op_type"] = "delete"
+            else:
+                action["_op_type"] = "index"
+                action["_source"] = record.dumps()
+            actions.append(action)
+
+        return search.helpers.bulk(
+            current_search_client,
+            actions,
+            stats_only=True,
+            ignore_status=(404,),
+            raise_on_error=False,
+        )
+
+
+def index_batches(index, batches, workers):
+    """Index batches of faculty profiles with a pool of ``workers`` threads.
+
+    At most two batches per worker are queued at once, so the ids are read
+    from the database as the workers progress. Returns the number of indexed
+    profiles and errors.
+    """
+    app = current_app._get_current_object()
+    indexed = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for ids in batches:
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    success, errors = future.result()
+                    indexed, failed = indexed + success, failed + errors
+            pending.add(executor.submit(index_batch, app, index, ids))
+
+        for future in pending:
+            success, errors = future.result()
+            indexed, failed = indexed + success, failed + errors
+    return indexed, failed
+
+
+def swap_aliases(new_index):
+    """Atomically move the aliases of the faculty profiles index to ``new_index``.
+
+    The current indices are found from the write alias of the index, and all
+    their aliases are moved, e.g. the ``facultyprofiles`` search alias along
+    with the write alias. Returns the names of the indices they were moved
+    from.
+    """
+    write_alias = build_alias_name(FacultyProfile.index._name)
+    old_indices = list(current_search_client.indices.get_alias(name=write_alias))
+    old_aliases = current_search_client.indices.get_alias(index=",".join(old_indices))
+
+    actions = []
+    for old_index, data in old_aliases.items():
+        for name in data["aliases"]:
+            actions.append({"remove": {"index": old_index, "alias": name}})
+            actions.append({"add": {"index": new_index, "alias": name}})
+    current_search_client.indices.update_aliases(body={"actions": actions})
+    return old_indices
+
+
+def reindex(workers, batch_size, delete_old=True):
+    """Reindex all faculty profiles into a new index, without search outage.
+
+    The profiles are indexed into a new index created from the current
+    mapping, which then takes over the aliases of the current index. The
+    profiles updated in the meantime are indexed again after the swap.
+    Returns the new index name and the number of indexed profiles and errors.
+    """
+    started = datetime.now(timezone.utc).replace(tzinfo=None)
+    (new_index, _), _ = current_search.create_index(
+        FacultyProfile.index._name,
+        suffix=timestamp_suffix(),
+        create_write_alias=False,
+    )
+
+    indexed, failed = index_batches(new_index, iter_id_batches(batch_size), workers)
+    current_search_client.indices.refresh(index=new_index)
+    old_indices = swap_aliases(new_index)
+
+    # Catch up with the profiles indexed into the old index during the run
+    _, caught_up_failed = index_batches(
+        new_index, iter_id_batches(batch_size, updated_since=started), workers
+    )
+    current_search_client.indices.refresh(index=new_index)
+
+    if delete_old and old_indices:
+        current_search_client.indices.delete(index=",".join(old_indices))
+    return new_index, indexed, failed + caught_up_failed
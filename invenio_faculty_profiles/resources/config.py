@@ -8,6 +8,7 @@
 
 """Config for Faculty Profile Resource."""
 
+import marshmallow as ma
 from flask_resources import (
     HTTPJSONException,
     JSONSerializer,
@@ -16,12 +17,59 @@ from flask_resources import (
 )
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_records_resources.resources.records import RecordResourceConfig
+from invenio_records_resources.resources.records.args import SearchRequestArgsSchema
 from invenio_records_resources.resources.records.headers import etag_headers
 from invenio_records_resources.services.base.config import ConfiguratorMixin, FromConfig
 
 from invenio_faculty_profiles.resources.serializer import UIFacultyProfileJSONSerializer
 
-from ..errors import PhotoSizeLimitError
+from ..errors import FileSizeLimitError
+from ..export import EXPORT_FORMATS
+
+
+class FacultyProfileSearchRequestArgsSchema(SearchRequestArgsSchema):
+    """Faculty profile search request arguments."""
+
+    cursor = ma.fields.String()
+
+
+class FacultyProfileExportArgsSchema(ma.Schema):
+    """Faculty profile export request arguments."""
+
+    class Meta:
+        """Meta attributes for the schema."""
+
+        unknown = ma.EXCLUDE
+
+    format = ma.fields.String(
+        load_default="jsonl", validate=ma.validate.OneOf(EXPORT_FORMATS)
+    )
+    updated_since = ma.fields.DateTime()
+
+
+class FacultyProfileChangesArgsSchema(ma.Schema):
+    """Faculty profile change feed request arguments."""
+
+    class Meta:
+        """Meta attributes for the schema."""
+
+        unknown = ma.EXCLUDE
+
+    since = ma.fields.String()
+    size = ma.fields.Integer(validate=ma.validate.Range(min=1, max=1000))
+
+
+class FacultyProfileSuggestArgsSchema(ma.Schema):
+    """Faculty profile suggestion request arguments."""
+
+    class Meta:
+        """Meta attributes for the schema."""
+
+        unknown = ma.EXCLUDE
+
+    q = ma.fields.String(required=True, validate=ma.validate.Length(min=1, max=100))
+    size = ma.fields.Integer(validate=ma.validate.Range(min=1, max=50))
+
 
 faculty_profile_error_handlers = RecordResourceConfig.error_handlers.copy()
 faculty_profile_error_handlers.update(
@@ -32,7 +80,7 @@ faculty_profile_error_handlers.update(
                 description="No file exists for this faculty profile.",
             )
         ),
-        PhotoSizeLimitError: create_error_handler(
+        FileSizeLimitError: create_error_handler(
             lambda e: HTTPJSONException(
                 code=400,
                 description=str(e),
@@ -57,11 +105,32 @@ class FacultyProfileResourceConfig(RecordResourceConfig, ConfiguratorMixin):
     routes = {
         "list": "",
         "item": "/<pid_value>",
+        "scan": "/_scan",
+        "suggest": "/_suggest",
+        "mget": "/_mget",
+        "export": "/_export",
+        "changes": "/changes",
         "photo": "/<pid_value>/photo",
+        "photo-rendition": "/<pid_value>/photo/<int:size>",
         "cv": "/<pid_value>/cv",
+        "file-upload": "/<pid_value>/<any(photo,cv):file_name>/upload",
+        "file-upload-part": "/<pid_value>/<any(photo,cv):file_name>/upload/<int:part>",
+        "file-upload-commit": "/<pid_value>/<any(photo,cv):file_name>/upload/commit",
         "item-record-list": "/<pid_value>/records",
     }
 
+    request_search_args = FacultyProfileSearchRequestArgsSchema
+    request_export_args = FacultyProfileExportArgsSchema
+    request_changes_args = FacultyProfileChangesArgsSchema
+    request_suggest_args = FacultyProfileSuggestArgsSchema
+
+    request_view_args = {
+        "pid_value": ma.fields.Str(),
+        "part": ma.fields.Int(),
+        "size": ma.fields.Int(),
+        "file_name": ma.fields.Str(),
+    }
+
     error_handlers = FromConfig(
         "FACULTY_PROFILES_ERROR_HANDLERS", default=faculty_profile_error_handlers
     )
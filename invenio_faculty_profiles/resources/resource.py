@@ -8,24 +8,32 @@
 
 """Resource for Faculty Profiles."""
 
-from flask import current_app, g
+import json
+
+from flask import current_app, g, request, stream_with_context
 from flask_resources import (
     Resource,
     ResourceConfig,
+    from_conf,
     request_body_parser,
+    request_parser,
     resource_requestctx,
     response_handler,
     route,
 )
 from invenio_records_resources.resources.records.resource import (
     RecordResource,
+    request_data,
     request_search_args,
     request_view_args,
 )
 from invenio_records_resources.resources.records.utils import search_preference
 from invenio_records_resources.services.base.config import ConfiguratorMixin
-from invenio_search_ui.searchconfig import search_app_config
+from werkzeug.http import is_resource_modified
 
+from ..export import EXPORT_FORMATS, serialize_export
+from ..searchapp import faculty_profiles_search_app_config
+from ..services.schema import FileTransferSchema, ReadManySchema
 from .parser import RequestFileNameAndStreamParser
 
 request_stream = request_body_parser(
@@ -33,6 +41,16 @@ request_stream = request_body_parser(
     default_content_type="application/octet-stream",
 )
 
+request_export_args = request_parser(from_conf("request_export_args"), location="args")
+
+request_changes_args = request_parser(
+    from_conf("request_changes_args"), location="args"
+)
+
+request_suggest_args = request_parser(
+    from_conf("request_suggest_args"), location="args"
+)
+
 #
 # Resource
 #
@@ -48,20 +66,26 @@ class FacultyProfileSearchConfigResource(Resource):
             route("GET", routes["search-config"], self.search_config),
         ]
 
-    @response_handler()
     def search_config(self):
-        """Search configuration."""
-        return (
-            search_app_config(
-                config_name="FACULTY_PROFILES_SEARCH",
-                available_facets=current_app.config["FACULTY_PROFILES_FACETS"],
-                sort_options=current_app.config["FACULTY_PROFILES_SORT_OPTIONS"],
-                headers={"Accept": "application/vnd.inveniordm.v1+json"},
-                pagination_options=(10, 20),
-                endpoint="/api/faculty-profiles",
-            ),
-            200,
+        """Search configuration, served with a strong ETag.
+
+        Its labels are translated in the locale of the request, taken from
+        the ``Accept-Language`` header, or from the session or the user
+        preferences, which depend on the session cookie. Caches revalidate
+        it on every use, answered with ``304 Not Modified`` until it changes.
+        """
+        _, body, etag = faculty_profiles_search_app_config(
+            headers={"Accept": "application/vnd.inveniordm.v1+json"}
         )
+        if is_resource_modified(request.environ, etag=etag):
+            response = current_app.response_class(body, mimetype="application/json")
+        else:
+            response = current_app.response_class(status=304)
+        response.set_etag(etag)
+        response.vary.update(["Accept-Language", "Cookie"])
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        return response
 
 
 class FacultyProfileSearchConfigResourceConfig(ResourceConfig, ConfiguratorMixin):
@@ -82,18 +106,82 @@ class FacultyProfileResource(RecordResource):
         return [
             route("GET", routes["list"], self.search),
             route("POST", routes["list"], self.create),
+            route("GET", routes["scan"], self.scan),
+            route("GET", routes["suggest"], self.suggest),
+            route("POST", routes["mget"], self.read_batch),
+            route("GET", routes["export"], self.export),
+            route("GET", routes["changes"], self.changes),
             route("GET", routes["item"], self.read),
             route("PUT", routes["item"], self.update),
             route("DELETE", routes["item"], self.delete),
             route("GET", routes["photo"], self.read_photo),
             route("PUT", routes["photo"], self.update_photo),
             route("DELETE", routes["photo"], self.delete_photo),
+            route("GET", routes["photo-rendition"], self.read_photo_rendition),
             route("GET", routes["cv"], self.read_cv),
             route("PUT", routes["cv"], self.update_cv),
             route("DELETE", routes["cv"], self.delete_cv),
+            route("POST", routes["file-upload"], self.init_file_transfer),
+            route("PUT", routes["file-upload-part"], self.set_file_transfer_part),
+            route("POST", routes["file-upload-commit"], self.commit_file_transfer),
             route("GET", routes["item-record-list"], self.item_record_search),
         ]
 
+    @request_search_args
+    def scan(self):
+        """Stream all the faculty profiles matching a search, as JSON lines."""
+        hits = self.service.scan_search(g.identity, params=resource_requestctx.args)
+        return current_app.response_class(
+            stream_with_context(json.dumps(hit) + "\n" for hit in hits),
+            mimetype="application/x-ndjson",
+        )
+
+    @request_suggest_args
+    @response_handler()
+    def suggest(self):
+        """Suggest faculty profiles for a search-as-you-type query."""
+        suggestions = self.service.suggest(
+            g.identity,
+            resource_requestctx.args["q"],
+            size=resource_requestctx.args.get("size"),
+        )
+        return suggestions.to_dict(), 200
+
+    @request_data
+    @response_handler(many=True)
+    def read_batch(self):
+        """Read many faculty profiles by their ids."""
+        data = ReadManySchema().load(resource_requestctx.data or {})
+        items = self.service.read_batch(g.identity, data["ids"])
+        return items.to_dict(), 200
+
+    @request_export_args
+    def export(self):
+        """Stream all the faculty profiles as JSON lines or CSV."""
+        args = resource_requestctx.args
+        profiles = self.service.export(
+            g.identity, updated_since=args.get("updated_since")
+        )
+        lines = serialize_export(
+            profiles,
+            args["format"],
+            current_app.config["FACULTY_PROFILES_EXPORT_CSV_COLUMNS"],
+        )
+        return current_app.response_class(
+            stream_with_context(lines), mimetype=EXPORT_FORMATS[args["format"]]
+        )
+
+    @request_changes_args
+    @response_handler()
+    def changes(self):
+        """Read the faculty profiles changed since a token."""
+        changes = self.service.read_changes(
+            g.identity,
+            since=resource_requestctx.args.get("since"),
+            size=resource_requestctx.args.get("size"),
+        )
+        return changes.to_dict(), 200
+
     @request_view_args
     def read_photo(self):
         """Read photo's content."""
@@ -102,7 +190,18 @@ class FacultyProfileResource(RecordResource):
             g.identity,
             ep_pid,
         )
-        return item.send_file(restricted=False)
+        return self._send_file(item)
+
+    @request_view_args
+    def read_photo_rendition(self):
+        """Read the content of a resized photo."""
+        item = self.service.read_photo_rendition(
+            g.identity,
+            resource_requestctx.view_args["pid_value"],
+            resource_requestctx.view_args["size"],
+        )
+        # The original photo is sent until the renditions are created
+        return self._send_file(item, revalidate=not item._file.key.startswith("photo-"))
 
     @request_view_args
     @request_stream
@@ -135,7 +234,7 @@ class FacultyProfileResource(RecordResource):
             g.identity,
             ep_pid,
         )
-        return item.send_file(restricted=False)
+        return self._send_file(item)
 
     @request_view_args
     @request_stream
@@ -160,6 +259,48 @@ class FacultyProfileResource(RecordResource):
         )
         return "", 204
 
+    @request_view_args
+    @request_data
+    @response_handler()
+    def init_file_transfer(self):
+        """Start the transfer of the photo or the cv."""
+        data = FileTransferSchema().load(resource_requestctx.data or {})
+        files = self.service.init_file_transfer(
+            g.identity,
+            resource_requestctx.view_args["pid_value"],
+            resource_requestctx.view_args["file_name"],
+            data["filename"],
+            data["transfer"],
+            data["size"],
+        )
+        return files.to_dict(), 201
+
+    @request_view_args
+    @request_stream
+    @response_handler()
+    def set_file_transfer_part(self):
+        """Upload one part of the photo or the cv."""
+        item = self.service.set_file_transfer_part(
+            g.identity,
+            resource_requestctx.view_args["pid_value"],
+            resource_requestctx.view_args["file_name"],
+            resource_requestctx.view_args["part"],
+            resource_requestctx.data["request_stream"],
+            content_length=resource_requestctx.data["request_content_length"],
+        )
+        return item.to_dict(), 200
+
+    @request_view_args
+    @response_handler()
+    def commit_file_transfer(self):
+        """Complete the multipart upload of the photo or the cv."""
+        item = self.service.commit_file_transfer(
+            g.identity,
+            resource_requestctx.view_args["pid_value"],
+            resource_requestctx.view_args["file_name"],
+        )
+        return item.to_dict(), 200
+
     @request_search_args
     @request_view_args
     @response_handler(many=True)
@@ -172,3 +313,36 @@ class FacultyProfileResource(RecordResource):
             search_preference=search_preference(),
         )
         return hits.to_dict(), 200
+
+    def _send_file(self, item, revalidate=False):
+        """Send a faculty profile file with HTTP caching headers.
+
+        The file checksum is used as ETag and its update time as
+        Last-Modified. Conditional requests matching them are answered with
+        ``304 Not Modified`` without opening the file storage. Redirections,
+        to remote files or presigned storage URLs, are not cached. With
+        ``revalidate``, caches check the file on every use instead of keeping
+        it for ``FACULTY_PROFILES_FILES_MAX_AGE`` seconds.
+        """
+        file_instance = item._file.object_version.file
+        etag = file_instance.checksum
+        modified = is_resource_modified(
+            request.environ, etag=etag, last_modified=file_instance.updated
+        )
+        if etag and not modified:
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            response.last_modified = file_instance.updated
+        else:
+            response = item.send_file(restricted=False)
+            if response.status_code in (301, 302, 303, 307, 308):
+                response.cache_control.no_store = True
+                return response
+
+        max_age = current_app.config["FACULTY_PROFILES_FILES_MAX_AGE"]
+        response.cache_control.public = True
+        if max_age is None or revalidate:
+            response.cache_control.no_cache = True
+        else:
+            response.cache_control.max_age = max_age
+        return response
@@ -8,22 +8,50 @@
 
 """Configuration helper for React-SearchKit."""
 
-from functools import partial
+import hashlib
+import json
 
 from flask import current_app
+from invenio_i18n import get_locale
 from invenio_search_ui.searchconfig import search_app_config
 
 
-def search_app_context():
-    """Search app context processor."""
-    return {
-        "search_app_faculty_profiles_config": partial(
-            search_app_config,
+def faculty_profiles_search_app_config(headers, **kwargs):
+    """Get the faculty profiles search app config, and its strong ETag.
+
+    The config only depends on the app configuration, the locale of its
+    labels and the arguments: it is computed once per app for each of them,
+    along with its JSON serialization, hashed into the ETag.
+    """
+    configs = current_app.extensions["invenio-faculty-profiles"].search_app_configs
+    key = (str(get_locale()), json.dumps([headers, kwargs], sort_keys=True))
+    if key not in configs:
+        config = search_app_config(
             config_name="FACULTY_PROFILES_SEARCH",
             available_facets=current_app.config["FACULTY_PROFILES_FACETS"],
             sort_options=current_app.config["FACULTY_PROFILES_SORT_OPTIONS"],
-            headers={"Accept": "application/json"},
+            headers=headers,
             pagination_options=(10, 20),
             endpoint="/api/faculty-profiles",
-        ),
+            **kwargs,
+        )
+        # Labels are translated once, in the locale of the key
+        body = json.dumps(config, default=str)
+        etag = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        configs[key] = (json.loads(body), body, etag)
+    return configs[key]
+
+
+def search_app_faculty_profiles_config(**kwargs):
+    """Get the search app config of the faculty profiles search page."""
+    config, _, _ = faculty_profiles_search_app_config(
+        headers={"Accept": "application/json"}, **kwargs
+    )
+    return config
+
+
+def search_app_context():
+    """Search app context processor."""
+    return {
+        "search_app_faculty_profiles_config": search_app_faculty_profiles_config,
     }
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cache of faculty profile search responses."""
+
+import hashlib
+import json
+import math
+import time
+from uuid import uuid4
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_search.engine import dsl
+
+SEARCH_VERSION_KEY = "faculty_profiles:search_version"
+"""Cache key of the version token of the cached search responses."""
+
+
+def invalidate_search_results():
+    """Drop the cached search responses, e.g. when profiles were indexed.
+
+    The new version token records when it was made, as the profiles just
+    indexed are not searchable before the next refresh of the index.
+    """
+    if current_app.config["FACULTY_PROFILES_SEARCH_CACHE_TIMEOUT"]:
+        # Never expires, so that searches do not all miss the cache at once
+        current_cache.set(SEARCH_VERSION_KEY, (uuid4().hex, time.time()), timeout=0)
+
+
+def _get_version():
+    """Get the version token of the cached search responses, creating it.
+
+    The token is made of a random value and of the time it was invalidated
+    at, ``None`` for the tokens created when there was none.
+    """
+    version = current_cache.get(SEARCH_VERSION_KEY)
+    if version is None:
+        version = (uuid4().hex, None)
+        if not current_cache.add(SEARCH_VERSION_KEY, version, timeout=0):
+            version = current_cache.get(SEARCH_VERSION_KEY)
+    return version
+
+
+def _wait_for_response(key, lock_key, lock_timeout):
+    """Wait for the response of a search executed by another request."""
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        raw = current_cache.get(key)
+        if raw is not None or current_cache.get(lock_key) is None:
+            return raw
+    return None
+
+
+def execute_search(search):
+    """Execute a search, sharing its response with the identical searches.
+
+    Responses are cached for ``FACULTY_PROFILES_SEARCH_CACHE_TIMEOUT`` seconds,
+    keyed by the search body, which holds the normalized parameters and the
+    permission filter of the identity. When identical searches miss the cache
+    at the same time, only one of them is sent to the search engine, the
+    others wait for its response. Responses cut short by the search timeout
+    are not cached.
+
+    For ``FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL`` seconds after the
+    responses were dropped, the profiles just indexed may not be searchable
+    yet: the responses of this window are cached under their own keys, until
+    its end only.
+    """
+    timeout = current_app.config["FACULTY_PROFILES_SEARCH_CACHE_TIMEOUT"]
+    if not timeout:
+        return search.execute()
+    version = _get_version()
+    if version is None:
+        return search.execute()
+
+    body = json.dumps(search.to_dict(), sort_keys=True, default=str)
+    digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    token, invalidated = version
+    key = f"faculty_profiles:search:{token}:{digest}"
+    if invalidated is not None:
+        refresh_interval = current_app.config[
+            "FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL"
+        ]
+        refreshed = invalidated + refresh_interval
+        if time.time() < refreshed:
+            key = f"{key}:refreshing"
+            timeout = min(timeout, math.ceil(refreshed - time.time()))
+
+    raw = current_cache.get(key)
+    if raw is not None:
+        return dsl.response.Response(search, raw)
+
+    lock_key = f"{key}:lock"
+    lock_timeout = current_app.config["FACULTY_PROFILES_SEARCH_CACHE_LOCK_TIMEOUT"]
+    if current_cache.add(lock_key, True, timeout=lock_timeout):
+        try:
+            response = search.execute()
+            if not response.timed_out:
+                current_cache.set(key, response.to_dict(), timeout=timeout)
+        finally:
+            current_cache.delete(lock_key)
+        return response
+
+    raw = _wait_for_response(key, lock_key, lock_timeout)
+    if raw is None:
+        return search.execute()
+    return dsl.response.Response(search, raw)
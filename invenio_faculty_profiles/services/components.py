@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio-Faculty-Profiles is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Service components."""
+
+from flask import current_app
+from invenio_records_resources.services.files.components import FileServiceComponent
+from invenio_records_resources.services.records.components import ServiceComponent
+from invenio_records_resources.services.uow import RecordCommitOp, TaskOp
+
+from ..tasks import (
+    attribute_record,
+    create_photo_renditions,
+    update_records_attribution,
+)
+from .service import get_file_size_limit
+
+
+def _attribution_enabled():
+    return current_app.config["FACULTY_PROFILES_RECORDS_ATTRIBUTION_ENABLED"]
+
+
+def _attribution_key(metadata):
+    """Profile metadata used to match records."""
+    identifiers = metadata.get("identifiers", [])
+    return (
+        metadata.get("family_name"),
+        metadata.get("given_names"),
+        sorted(identifier["identifier"] for identifier in identifiers),
+    )
+
+
+class RecordsAttributionComponent(ServiceComponent):
+    """Recompute the records attributed to a faculty profile.
+
+    Must run before the data component, to compare the stored metadata with
+    the incoming one on update.
+    """
+
+    def create(self, identity, data=None, record=None, **kwargs):
+        """Attribute records to a new profile."""
+        if _attribution_enabled():
+            self.uow.register(TaskOp(update_records_attribution, str(record.id)))
+
+    def update(self, identity, data=None, record=None, **kwargs):
+        """Attribute records again when the name or identifiers change."""
+        if not _attribution_enabled():
+            return
+        old_key = _attribution_key(record.get("metadata", {}))
+        new_key = _attribution_key(data.get("metadata", {}))
+        if old_key != new_key:
+            self.uow.register(TaskOp(update_records_attribution, str(record.id)))
+
+
+class FacultyProfilesRecordComponent(ServiceComponent):
+    """Attribute published records to faculty profiles.
+
+    Meant to be added to ``RDM_RECORDS_SERVICE_COMPONENTS``.
+    """
+
+    def publish(self, identity, draft=None, record=None, **kwargs):
+        """Attribute the published record."""
+        if _attribution_enabled():
+            self.uow.register(TaskOp(attribute_record, record["id"]))
+
+
+class FileSlotsComponent(FileServiceComponent):
+    """Fill the file slot of a faculty profile once its transfer is committed.
+
+    Multipart uploads are committed by ``commit_file_transfer``, fetched files
+    by the fetch task, once downloaded.
+    """
+
+    def commit_file(self, identity, id_, file_key, record):
+        """Check the size of the committed file and fill its slot."""
+        file_name = file_key.split(".", 1)[0]
+        if file_name not in record.attachments.names:
+            return
+
+        size_limit, error_cls = get_file_size_limit(file_name)
+        size = record.files[file_key].file.size
+        if size > size_limit:
+            raise error_cls(size_limit, size)
+
+        record.attachments.set(file_name, file_key)
+        self.uow.register(RecordCommitOp(record))
+        if file_name == "photo":
+            self.uow.register(TaskOp(create_photo_renditions, str(id_)))
@@ -20,15 +20,19 @@ from invenio_records_resources.services.records.components import DataComponent
 from invenio_records_resources.services.records.config import (
     SearchOptions as SearchOptionsBase,
 )
+from invenio_records_resources.services.records.links import pagination_endpoint_links
 from invenio_records_resources.services.records.params import (
     FacetsParam,
     PaginationParam,
-    QueryStrParam,
     SortParam,
 )
 
 from ..records.api import FacultyProfile
+from .components import FileSlotsComponent, RecordsAttributionComponent
+from .indexer import FacultyProfileIndexer
+from .params import CursorParam, QueryCostGuardParam
 from .permissions import FacultyProfilePermissionPolicy
+from .results import FacultyProfileList
 from .schema import FacultyProfileSchema
 
 
@@ -37,14 +41,33 @@ def link_vars(record, vars):
     vars.update({"pid_value": str(record.id)})
 
 
+def photo_rendition_link(size):
+    """Link to the photo rendition of the given size."""
+
+    def rendition_link_vars(record, vars):
+        vars.update({"pid_value": str(record.id), "size": size})
+
+    return EndpointLink(
+        endpoint="faculty-profiles.read_photo_rendition",
+        params=["pid_value", "size"],
+        vars=rendition_link_vars,
+    )
+
+
+def suggestion_link_vars(hit, vars):
+    """Update link vars with the pid_value of a suggestion hit."""
+    vars.update({"pid_value": hit["id"], "size": 64})
+
+
 class SearchOptions(SearchOptionsBase, SearchOptionsMixin):
     """Search options."""
 
     facets = {}
     params_interpreters_cls = [
-        QueryStrParam,
+        QueryCostGuardParam,
         PaginationParam,
         SortParam,
+        CursorParam,
         FacetsParam,
     ]
 
@@ -67,12 +90,15 @@ class FacultyProfileServiceConfig(RecordServiceConfig, ConfiguratorMixin):
 
     # Service schema
     schema = FacultyProfileSchema
+    result_list_cls = FacultyProfileList
 
     # Common configuration
     permission_policy_cls = FacultyProfilePermissionPolicy
+    indexer_cls = FacultyProfileIndexer
     indexer_queue_name = "facultyprofiles"
 
     components = [
+        RecordsAttributionComponent,
         DataComponent,
     ]
 
@@ -97,6 +123,9 @@ class FacultyProfileServiceConfig(RecordServiceConfig, ConfiguratorMixin):
             params=["pid_value"],
             vars=link_vars,
         ),
+        "photo_small": photo_rendition_link(64),
+        "photo_medium": photo_rendition_link(128),
+        "photo_large": photo_rendition_link(512),
         "cv": EndpointLink(
             endpoint="faculty-profiles.read_cv",
             params=["pid_value"],
@@ -109,14 +138,56 @@ class FacultyProfileServiceConfig(RecordServiceConfig, ConfiguratorMixin):
         ),
     }
 
+    links_search = {
+        **pagination_endpoint_links("faculty-profiles.search"),
+        "next_cursor": EndpointLink(
+            "faculty-profiles.search",
+            when=lambda pagination, ctx: pagination.next_cursor is not None,
+            vars=lambda pagination, vars: vars["args"].update(
+                {"cursor": pagination.next_cursor, "page": None}
+            ),
+        ),
+    }
+
+    links_suggestion = {
+        "self_html": EndpointLink(
+            endpoint="invenio_faculty_profiles.faculty_profile_detail",
+            params=["pid_value"],
+            vars=suggestion_link_vars,
+        ),
+        "photo_small": EndpointLink(
+            endpoint="faculty-profiles.read_photo_rendition",
+            params=["pid_value", "size"],
+            when=lambda hit, ctx: "photo" in (hit.get("attachments") or {}),
+            vars=suggestion_link_vars,
+        ),
+    }
+
+    links_changes = {
+        "next": EndpointLink(
+            "faculty-profiles.changes",
+            when=lambda changes, ctx: changes.next_since is not None,
+            vars=lambda changes, vars: vars["args"].update(
+                {"since": changes.next_since}
+            ),
+        ),
+    }
+
 
 class FacultyProfileFileServiceConfig(FileServiceConfig, ConfiguratorMixin):
     """Faculty Profile File Record service config."""
 
+    service_id = "facultyprofiles-files"
+
     permission_policy_cls = FacultyProfilePermissionPolicy
 
     record_cls = FacultyProfile
 
+    components = [
+        *FileServiceConfig.components,
+        FileSlotsComponent,
+    ]
+
     file_links_item = {
         "self": FileLink("{+api}/faculty-profiles/{id}/{+key}"),
     }
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Faculty profile indexer."""
+
+from flask import current_app
+from invenio_indexer.api import RecordIndexer
+from sqlalchemy.orm.exc import NoResultFound
+
+from .cache import invalidate_search_results
+
+
+class FacultyProfileIndexer(RecordIndexer):
+    """Record indexer which can defer indexing to its bulk queue.
+
+    With ``FACULTY_PROFILES_ASYNC_INDEXING``, indexing and deleting a profile
+    only queue its id. The queue consumer sends one action per profile, built
+    from its state in the database when the queue is processed, however many
+    times the profile was queued: the updates made between two runs of the
+    consumer are coalesced into a single index or delete action.
+    """
+
+    @property
+    def is_async(self):
+        """Whether indexing is deferred to the bulk queue."""
+        return current_app.config["FACULTY_PROFILES_ASYNC_INDEXING"]
+
+    def index(self, record, arguments=None, **kwargs):
+        """Index a record, or queue it when indexing asynchronously."""
+        if self.is_async:
+            self.bulk_index([record.id])
+            return None
+        result = super().index(record, arguments=arguments, **kwargs)
+        invalidate_search_results()
+        return result
+
+    def delete(self, record, **kwargs):
+        """Delete a record from the index, or queue it when asynchronous."""
+        if self.is_async:
+            self.bulk_index([record.id])
+            return None
+        result = super().delete(record, **kwargs)
+        invalidate_search_results()
+        return result
+
+    def process_bulk_queue(self, search_bulk_kwargs=None, bulk_index_max_items=None):
+        """Process the bulk indexing queue, then drop the cached searches.
+
+        Failed actions, e.g. deleting a profile which was never indexed, are
+        counted instead of aborting the run.
+        """
+        search_bulk_kwargs = {
+            "raise_on_error": False,
+            **(search_bulk_kwargs or {}),
+        }
+        result = super().process_bulk_queue(
+            search_bulk_kwargs=search_bulk_kwargs,
+            bulk_index_max_items=bulk_index_max_items,
+        )
+        invalidate_search_results()
+        return result
+
+    def _actionsiter(self, message_iterator):
+        """Iterate bulk actions, one per profile whatever its number of messages."""
+        messages = {}
+        for message in message_iterator:
+            messages.setdefault(message.decode()["id"], []).append(message)
+
+        for id_, id_messages in messages.items():
+            try:
+                yield self._profile_action(id_)
+                for message in id_messages:
+                    message.ack()
+            except NoResultFound:
+                for message in id_messages:
+                    message.reject()
+            except Exception:
+                for message in id_messages:
+                    message.reject()
+                current_app.logger.error(
+                    "Failed to index record {0}".format(id_), exc_info=True
+                )
+
+    def _profile_action(self, id_):
+        """Bulk action bringing the index up to date with a profile."""
+        record = self.record_cls.get_record(id_, with_deleted=True)
+        index = self.record_to_index(record)
+        action = {
+            "_index": self._prepare_index(index),
+            "_id": str(record.id),
+            "_version": record.revision_id,
+            "_version_type": self._version_type,
+        }
+        if record.is_deleted:
+            action["_op_type"] = "delete"
+        else:
+            arguments = {}
+            action["_op_type"] = "index"
+            action["_source"] = self._prepare_record(record, index, arguments)
+            action.update(arguments)
+        return action
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio-Faculty-Profiles is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Search parameter interpreters."""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from uuid import UUID
+
+from flask import current_app
+from invenio_i18n import gettext as _
+from invenio_records_resources.services.errors import QuerystringValidationError
+from invenio_records_resources.services.records.params import QueryStrParam
+from invenio_records_resources.services.records.params.base import ParamInterpreter
+from luqum.exceptions import ParseError
+from luqum.parser import parser as luqum_parser
+from luqum.tree import SearchField
+from luqum.visitor import TreeTransformer
+
+
+def encode_cursor(sort, sort_values):
+    """Encode the sort values of a hit into an opaque cursor."""
+    data = json.dumps([sort, sort_values], separators=(",", ":"))
+    return urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(sort, cursor):
+    """Decode the sort values of a cursor made for the ``sort`` option."""
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        cursor_sort, sort_values = json.loads(urlsafe_b64decode(cursor + padding))
+    except (ValueError, TypeError):
+        raise QuerystringValidationError(_("Invalid cursor."))
+    if cursor_sort != sort or not isinstance(sort_values, list):
+        raise QuerystringValidationError(_("Invalid cursor."))
+    return sort_values
+
+
+def encode_change_token(updated, id_):
+    """Encode the position of a faculty profile in the change feed."""
+    return encode_cursor("changes", [updated.isoformat(), str(id_)])
+
+
+def decode_change_token(token):
+    """Decode a change feed token into an ``(updated, id)`` position."""
+    values = decode_cursor("changes", token)
+    try:
+        updated, id_ = values
+        return datetime.fromisoformat(updated), UUID(id_)
+    except (ValueError, TypeError, AttributeError):
+        raise QuerystringValidationError(_("Invalid cursor."))
+
+
+class CursorParam(ParamInterpreter):
+    """Keyset pagination with ``search_after``.
+
+    The profile id is added as a last sort field, so that every hit has a
+    unique sort key. Given a ``cursor``, the search resumes after the hit it
+    was made from, whatever the depth of the page.
+    """
+
+    def apply(self, identity, search, params):
+        """Evaluate the cursor on the search."""
+        sort = search.to_dict().get("sort", [])
+        search = search.sort(*sort, {"id": "asc"})
+
+        cursor = params.get("cursor")
+        if cursor:
+            sort_values = decode_cursor(params.get("sort"), cursor)
+            search = search.extra(from_=0, search_after=sort_values)
+        return search
+
+
+class QueryCostTransformer(TreeTransformer):
+    """Count the clauses of a query, rewriting or rejecting expensive ones.
+
+    Leading wildcards, which scan every term of a field, and regular
+    expressions are rejected. The wildcard terms of the fields listed in
+    ``wildcard_fields`` are searched on their prefix-indexed subfield, and
+    ``rewritten`` tells whether any was. Clauses are counted in
+    ``context["cost"]``, along with the wildcard and fuzzy terms which the
+    search engine expands into many.
+    """
+
+    def __init__(self, wildcard_fields=None, **kwargs):
+        """Constructor."""
+        super().__init__(**kwargs)
+        self.wildcard_fields = wildcard_fields or {}
+        self.rewritten = False
+
+    def visit_search_field(self, node, context):
+        """Visit a field, whose wildcard terms may move to its subfield."""
+        subfield = self.wildcard_fields.get(node.name)
+        (new_node,) = self.generic_visit(node, {**context, "subfield": subfield})
+        if isinstance(new_node.expr, SearchField) and new_node.expr.name == subfield:
+            # The field holds a single wildcard term, search it on the subfield
+            new_node = new_node.expr.clone_item(expr=new_node.expr.expr)
+            new_node.head, new_node.tail = node.head, node.tail
+        yield new_node
+
+    def visit_word(self, node, context):
+        """Count a term, rejecting leading wildcards."""
+        context["cost"]["clauses"] += 1
+        if not node.has_wildcard() or node.is_wildcard():
+            yield from self.generic_visit(node, context)
+            return
+
+        if node.value.startswith(("*", "?")):
+            raise QuerystringValidationError(
+                _("Wildcards are not allowed at the start of search terms.")
+            )
+        context["cost"]["expansions"] += 1
+        subfield = context.get("subfield")
+        if not subfield:
+            yield from self.generic_visit(node, context)
+            return
+
+        self.rewritten = True
+        new_node = SearchField(subfield, node.clone_item(head="", tail=""))
+        new_node.head, new_node.tail = node.head, node.tail
+        yield new_node
+
+    def visit_phrase(self, node, context):
+        """Count a phrase."""
+        context["cost"]["clauses"] += 1
+        yield from self.generic_visit(node, context)
+
+    def visit_range(self, node, context):
+        """Count a range, whose bounds are not terms."""
+        context["cost"]["clauses"] += 1
+        yield node
+
+    def visit_fuzzy(self, node, context):
+        """Count a fuzzy term."""
+        context["cost"]["expansions"] += 1
+        yield from self.visit_proximity(node, context)
+
+    def visit_proximity(self, node, context):
+        """Visit an approximation, keeping its degree implicit if it was."""
+        (new_node,) = self.generic_visit(node, context)
+        # Cloned approximations are given their default degree explicitly
+        new_node._implicit_degree = node._implicit_degree
+        yield new_node
+
+    def visit_regex(self, node, context):
+        """Reject regular expressions."""
+        raise QuerystringValidationError(
+            _("Regular expressions are not allowed in search queries.")
+        )
+
+
+def guard_query(query_str):
+    """Rewrite a query string in a cheaper form, or reject it if too costly.
+
+    Queries which cannot be parsed are returned as they are, the query parser
+    then falls back to matching them as plain text.
+    """
+    config = current_app.config
+    if len(query_str) > config["FACULTY_PROFILES_QUERY_MAX_LENGTH"]:
+        raise QuerystringValidationError(_("The search query is too long."))
+    try:
+        tree = luqum_parser.parse(query_str)
+    except ParseError:
+        return query_str
+    except RecursionError:
+        raise QuerystringValidationError(_("The search query is too complex."))
+
+    cost = {"clauses": 0, "expansions": 0}
+    transformer = QueryCostTransformer(
+        wildcard_fields=config["FACULTY_PROFILES_QUERY_WILDCARD_FIELDS"]
+    )
+    tree = transformer.visit(tree, context={"cost": cost})
+    if cost["clauses"] > config["FACULTY_PROFILES_QUERY_MAX_CLAUSES"]:
+        raise QuerystringValidationError(_("The search query has too many terms."))
+    if cost["expansions"] > config["FACULTY_PROFILES_QUERY_MAX_EXPANSIONS"]:
+        raise QuerystringValidationError(
+            _("The search query has too many wildcard or fuzzy terms.")
+        )
+    # Queries are sent as written unless rewritten, as printing the tree back
+    # does not keep their exact form, e.g. of fuzzy terms.
+    return str(tree) if transformer.rewritten else query_str
+
+
+class QueryCostGuardParam(QueryStrParam):
+    """Evaluate the ``q`` parameter once made cheap enough to run.
+
+    The query string goes through :func:`guard_query` first, and all the
+    searches are given the ``FACULTY_PROFILES_SEARCH_TIMEOUT``: a search which
+    runs out of time returns the hits found so far.
+    """
+
+    def apply(self, identity, search, params):
+        """Evaluate the guarded query str on the search."""
+        timeout = current_app.config["FACULTY_PROFILES_SEARCH_TIMEOUT"]
+        if timeout:
+            search = search.extra(timeout=timeout)
+
+        if params.get("q"):
+            params = {**params, "q": guard_query(params["q"])}
+        return super().apply(identity, search, params)
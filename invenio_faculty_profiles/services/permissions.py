@@ -8,9 +8,17 @@
 
 """Permissions for Faculty Profile service functions."""
 
+from functools import lru_cache
+
+from flask import g
 from invenio_administration.generators import Administration
 from invenio_records_permissions import RecordPermissionPolicy
-from invenio_records_permissions.generators import AnyUser, SystemProcess
+from invenio_records_permissions.generators import (
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    SystemProcess,
+)
 from invenio_records_resources.services.files.generators import IfTransferType
 from invenio_records_resources.services.files.transfer import LOCAL_TRANSFER_TYPE
 
@@ -19,6 +27,7 @@ class FacultyProfilePermissionPolicy(RecordPermissionPolicy):
     """Faculty Profile Permission Policy class."""
 
     can_search = [AnyUser(), SystemProcess()]
+    can_scan = [Administration(), SystemProcess()]
     can_create = [Administration(), SystemProcess()]
     can_update = [Administration(), SystemProcess()]
     can_delete = [Administration(), SystemProcess()]
@@ -38,3 +47,50 @@ class FacultyProfilePermissionPolicy(RecordPermissionPolicy):
     can_update_files = [Administration(), SystemProcess()]
     can_delete_files = [Administration(), SystemProcess()]
     can_search_records = [AnyUser(), SystemProcess()]
+    can_export = [Administration(), SystemProcess()]
+
+
+RECORD_INDEPENDENT_GENERATORS = (
+    Administration,
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    SystemProcess,
+)
+"""Generators whose needs do not depend on the record being checked."""
+
+
+@lru_cache(maxsize=None)
+def is_record_independent(policy_cls, action):
+    """Tell if all the generators of an action ignore the record."""
+    generators = getattr(policy_cls, f"can_{action}", None)
+    if generators is None:
+        return False
+    return all(
+        isinstance(generator, RECORD_INDEPENDENT_GENERATORS) for generator in generators
+    )
+
+
+def check_permissions(service, identity, actions, record=None):
+    """Check the permissions of ``identity`` for ``actions`` on ``record``.
+
+    Actions which do not depend on the record are evaluated once per request
+    and identity, and their result shared by all the records checked.
+    """
+    policy_cls = service.config.permission_policy_cls
+    memo = g.setdefault("faculty_profiles_permissions", {})
+    identity_key = (identity.id, frozenset(identity.provides))
+
+    permissions = {}
+    for action in actions:
+        if not is_record_independent(policy_cls, action):
+            permissions[f"can_{action}"] = service.check_permission(
+                identity, action, record=record
+            )
+            continue
+
+        key = (policy_cls, action, identity_key)
+        if key not in memo:
+            memo[key] = service.check_permission(identity, action, record=record)
+        permissions[f"can_{action}"] = memo[key]
+    return permissions
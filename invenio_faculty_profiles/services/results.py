@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio-Faculty-Profiles is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Faculty profile service results."""
+
+from invenio_records_resources.services.records.results import RecordList
+
+from .params import encode_cursor
+
+
+class FacultyProfileList(RecordList):
+    """List of faculty profiles result."""
+
+    @property
+    def next_cursor(self):
+        """Cursor to the page following this one, if there is one."""
+        hits = getattr(self._results, "hits", None)
+        if not hits or len(hits) < self._params["size"]:
+            return None
+        return encode_cursor(self._params["sort"], list(hits[-1].meta.sort))
+
+    @property
+    def pagination(self):
+        """Create a pagination object, carrying the next page cursor."""
+        pagination = super().pagination
+        pagination.next_cursor = self.next_cursor
+        return pagination
+
+    def to_dict(self):
+        """Return result as a dictionary, flagging partial results."""
+        res = super().to_dict()
+        if getattr(self._results, "timed_out", False):
+            res["timed_out"] = True
+        return res
+
+
+class FacultyProfileChanges:
+    """Page of the faculty profiles change feed."""
+
+    def __init__(self, service, identity, changes, next_since, links_tpl=None):
+        """Constructor."""
+        self._service = service
+        self._identity = identity
+        self._changes = changes
+        self._next_since = next_since
+        self._links_tpl = links_tpl
+
+    @property
+    def next_since(self):
+        """Token to get the changes following this page."""
+        return self._next_since
+
+    @property
+    def hits(self):
+        """Iterate over the changes of the page, oldest first."""
+        return iter(self._changes)
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        res = {
+            "hits": {"hits": list(self.hits)},
+            "next_since": self.next_since,
+        }
+        if self._links_tpl:
+            res["links"] = self._links_tpl.expand(self._identity, self)
+        return res
+
+
+class FacultyProfileItems:
+    """Faculty profiles read at once by their ids."""
+
+    def __init__(self, service, identity, items, errors):
+        """Constructor."""
+        self._service = service
+        self._identity = identity
+        self._items = items
+        self._errors = errors
+
+    @property
+    def total(self):
+        """Number of faculty profiles read."""
+        return len(self._items)
+
+    @property
+    def hits(self):
+        """Iterate over the faculty profiles, in the order of their ids."""
+        return iter(self._items)
+
+    @property
+    def errors(self):
+        """Ids which could not be read, with the reason."""
+        return self._errors
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        return {
+            "hits": {"hits": list(self.hits), "total": self.total},
+            "errors": self.errors,
+        }
+
+
+class FacultyProfileSuggestions:
+    """Faculty profiles suggested for a search-as-you-type query."""
+
+    def __init__(self, service, identity, results, links_item_tpl=None):
+        """Constructor."""
+        self._service = service
+        self._identity = identity
+        self._results = results
+        self._links_item_tpl = links_item_tpl
+
+    @property
+    def hits(self):
+        """Iterate over the suggested faculty profiles, best match first."""
+        for hit in self._results:
+            source = hit.to_dict()
+            metadata = source.get("metadata", {})
+            projection = {
+                "id": source["id"],
+                "name": " ".join(
+                    filter(
+                        None,
+                        [metadata.get("given_names"), metadata.get("family_name")],
+                    )
+                ),
+                "department": metadata.get("department"),
+                "institution": metadata.get("institution"),
+            }
+            if self._links_item_tpl:
+                projection["links"] = self._links_item_tpl.expand(
+                    self._identity, source
+                )
+            yield projection
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        return {"hits": {"hits": list(self.hits)}}
@@ -10,9 +10,9 @@
 
 from functools import partial
 
-import phonenumbers
 from flask import current_app
 from invenio_i18n import lazy_gettext as _
+from invenio_records_resources.services.files.transfer import MULTIPART_TRANSFER_TYPE
 from invenio_records_resources.services.records.schema import (
     BaseRecordSchema as InvenioBaseRecordSchema,
 )
@@ -22,7 +22,16 @@ from invenio_vocabularies.contrib.subjects.schema import SubjectRelationSchema
 from invenio_vocabularies.services.schema import (
     VocabularyRelationSchema as VocabularySchema,
 )
-from marshmallow import EXCLUDE, Schema, ValidationError, fields, validate, validates
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    fields,
+    post_load,
+    validate,
+    validates,
+    validates_schema,
+)
 from marshmallow_utils.context import context_schema
 from marshmallow_utils.fields import (
     IdentifierSet,
@@ -34,6 +43,8 @@ from marshmallow_utils.schemas import IdentifierSchema
 from werkzeug.local import LocalProxy
 
 from ..proxies import current_profiles_service
+from ..utils import normalize_telephone, telephone_region
+from .permissions import check_permissions
 
 facuty_profiles_handlers = LocalProxy(
     lambda: current_app.config["FACULTY_PROFILES_HANDLERS"]
@@ -70,6 +81,52 @@ class FilesSchema(Schema):
     )
 
 
+class ReadManySchema(Schema):
+    """Schema of the ids of the faculty profiles to read at once."""
+
+    ids = fields.List(fields.String(), required=True, validate=validate.Length(min=1))
+
+
+class FileTransferSchema(Schema):
+    """Schema to start the transfer of a file.
+
+    All transfers need the ``size`` of the file, multipart uploads also its
+    ``parts`` and ``part_size``, fetched and remote files their ``url``.
+    """
+
+    filename = SanitizedUnicode(required=True)
+    size = fields.Integer(required=True, validate=validate.Range(min=1))
+    transfer_type = fields.String(load_default=MULTIPART_TRANSFER_TYPE)
+    parts = fields.Integer(validate=validate.Range(min=1))
+    part_size = fields.Integer(validate=validate.Range(min=1))
+    url = fields.Url()
+
+    @validates_schema
+    def validate_transfer(self, data, **kwargs):
+        """Validate that the fields of the transfer type are given."""
+        if data["transfer_type"] == MULTIPART_TRANSFER_TYPE:
+            required = ("parts", "part_size")
+        else:
+            required = ("url",)
+        errors = {
+            name: [_("Missing data for required field.")]
+            for name in required
+            if name not in data
+        }
+        if errors:
+            raise ValidationError(errors)
+
+    @post_load
+    def load_transfer(self, data, **kwargs):
+        """Group the transfer fields as expected by the files service."""
+        transfer = {"type": data.pop("transfer_type")}
+        for name in ("parts", "part_size", "url"):
+            if name in data:
+                transfer[name] = data.pop(name)
+        data["transfer"] = transfer
+        return data
+
+
 class FundingSchema(Schema):
     """Funding schema."""
 
@@ -104,6 +161,7 @@ class FacultyProfileMetadataSchema(Schema):
     )
     website = SanitizedUnicode(validate=validate.URL(error=_("Not a valid URL.")))
     telephone = SanitizedUnicode()
+    telephone_e164 = SanitizedUnicode(dump_only=True)
 
     funding = fields.List(fields.Nested(FundingSchema))
 
@@ -122,14 +180,19 @@ class FacultyProfileMetadataSchema(Schema):
     office_address = SanitizedHTML(validate=validate.Length(min=3))
 
     @validates("telephone")
-    def validate_description(self, value):
+    def validate_telephone(self, value):
         """Validate a phone number."""
-        try:
-            p = phonenumbers.parse(value, "US")  # FIXME: get current locale
-            if not phonenumbers.is_valid_number(p):
-                raise ValidationError(_("Invalid phone number format"))
-        except Exception as ex:
-            raise ValidationError(_("Invalid phone number format")) from ex
+        if normalize_telephone(value, telephone_region()) is None:
+            raise ValidationError(_("Invalid phone number format"))
+
+    @post_load
+    def load_telephone_e164(self, data, **kwargs):
+        """Store the E.164 form of the phone number, to match it exactly."""
+        if data.get("telephone"):
+            data["telephone_e164"] = normalize_telephone(
+                data["telephone"], telephone_region()
+            )
+        return data
 
 
 class FacultyProfileSchema(InvenioBaseRecordSchema):
@@ -144,18 +207,24 @@ class FacultyProfileSchema(InvenioBaseRecordSchema):
     metadata = NestedAttribute(FacultyProfileMetadataSchema, required=True)
     active = fields.Boolean(default=True)
     files = NestedAttribute(FilesSchema)
+    # Not named after the record key, or the data component would drop the
+    # stored slots on every update.
+    file_slots = fields.Method("dump_attachments", data_key="attachments")
 
     permissions = fields.Method("load_permissions")
 
+    def dump_attachments(self, obj):
+        """Dump the keys of the files held by the named file slots."""
+        return obj.attachments.to_dict()
+
     def load_permissions(self, *args, **kwargs):
         """Load permissions."""
         record = context_schema.get()["record"]
         identity = context_schema.get()["identity"]
-        return {
-            f"can_{action}": current_profiles_service.check_permission(
-                identity, action, record=record
-            )
-            for action in (
+        return check_permissions(
+            current_profiles_service,
+            identity,
+            (
                 "create",
                 "update",
                 "delete",
@@ -163,5 +232,6 @@ class FacultyProfileSchema(InvenioBaseRecordSchema):
                 "commit_files",
                 "update_files",
                 "delete_files",
-            )
-        }
+            ),
+            record=record,
+        )
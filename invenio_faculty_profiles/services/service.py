@@ -9,18 +9,59 @@
 """Faculty Profile Services."""
 
 import os
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
 from flask import current_app
+from invenio_db import db
+from invenio_files_rest.errors import FileSizeError
+from invenio_i18n import gettext as _
 from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_records_permissions.api import permission_filter
 from invenio_records_resources.services import LinksTemplate
+from invenio_records_resources.services.files.transfer import REMOTE_TRANSFER_TYPE
 from invenio_records_resources.services.records import RecordService
 from invenio_records_resources.services.uow import (
+    RecordBulkIndexOp,
     RecordCommitOp,
+    TaskOp,
     unit_of_work,
 )
+from invenio_search import current_search_client
 from invenio_search.engine import dsl
+from invenio_search.utils import build_alias_name
+from jsonschema.exceptions import ValidationError as SchemaValidationError
+from marshmallow import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from ..errors import CVSizeLimitError, PhotoSizeLimitError
+from ..records.models import FacultyProfileRecordModel
+from ..tasks import create_photo_renditions
+from ..utils import chunked, make_image_rendition, profile_matches_creator
+from .cache import execute_search
+from .params import decode_change_token, encode_change_token
+from .permissions import check_permissions
+from .results import (
+    FacultyProfileChanges,
+    FacultyProfileItems,
+    FacultyProfileSuggestions,
+)
+
+PHOTO_RENDITION_EXTENSIONS = {"WEBP": ".webp", "JPEG": ".jpg"}
+
+FILE_SIZE_LIMITS = {
+    "photo": ("FACULTY_PROFILES_PHOTO_MAX_FILE_SIZE", 10**6, PhotoSizeLimitError),
+    "cv": ("FACULTY_PROFILES_CV_MAX_FILE_SIZE", 10 * 10**6, CVSizeLimitError),
+}
 
-from ..errors import PhotoSizeLimitError
+
+def get_file_size_limit(file_name):
+    """Get the size limit of a file slot in bytes, and its error class."""
+    config_key, default, error_cls = FILE_SIZE_LIMITS[file_name]
+    max_size = current_app.config.get(config_key)
+    if type(max_size) is int and max_size > 0:
+        return max_size, error_cls
+    return default, error_cls
 
 
 class FacultyProfileService(RecordService):
@@ -43,10 +84,129 @@ class FacultyProfileService(RecordService):
         """Read the faculty profile's photo."""
         return self._read_file(identity, "photo", id_)
 
+    def read_photo_rendition(self, identity, id_, size):
+        """Read the smallest photo rendition covering ``size`` pixels.
+
+        Falls back to the original photo when no rendition is large enough or
+        the renditions were not created yet.
+        """
+        record = self.record_cls.pid.resolve(id_)
+        self.require_permission(identity, "read", record=record)
+        file_key = record.attachments.get("photo")
+        if file_key is None:
+            raise FileNotFoundError()
+
+        sizes = current_app.config["FACULTY_PROFILES_PHOTO_RENDITION_SIZES"]
+        rendition_size = min((s for s in sizes if s >= size), default=None)
+        if rendition_size is not None:
+            image_format = current_app.config["FACULTY_PROFILES_PHOTO_RENDITION_FORMAT"]
+            extension = PHOTO_RENDITION_EXTENSIONS[image_format]
+            rendition_key = f"photo-{rendition_size}{extension}"
+            if rendition_key in record.files:
+                file_key = rendition_key
+
+        record_file = record.files.get(file_key)
+        if record_file is None:
+            raise FileNotFoundError()
+        return self.files.file_result_item(
+            self.files,
+            identity,
+            record_file,
+            record,
+            links_tpl=self.files.file_links_item_tpl(id_),
+        )
+
     def read_cv(self, identity, id_):
         """Read the faculty profile's cv."""
         return self._read_file(identity, "cv", id_)
 
+    def read_with_attachments(self, identity, id_, actions=None, expand=False):
+        """Read a faculty profile along with its permissions and attachments.
+
+        The record is resolved once. Returns the result item, the permissions
+        of ``identity`` for ``actions`` and a mapping telling which file slots
+        hold a file.
+        """
+        item = self.read(identity, id_, expand=expand)
+        permissions = item.has_permissions_to(actions) if actions else {}
+        attachments = {
+            name: name in item.data["attachments"]
+            for name in self.record_cls.attachments.names
+        }
+        return item, permissions, attachments
+
+    def read_batch(self, identity, ids):
+        """Read many faculty profiles by their ids, from the database.
+
+        The profiles are loaded with a single query, and serialized like
+        :meth:`read` does, in the order of ``ids``. The ids which are unknown,
+        deleted or not readable by ``identity`` are returned as errors
+        instead of failing the whole read. Unlike :meth:`read_many`, which
+        searches the index for some fields of the profiles, the complete
+        profiles are returned, up to date with the database.
+        """
+        max_ids = current_app.config["FACULTY_PROFILES_READ_MANY_MAX_IDS"]
+        ids = list(dict.fromkeys(str(id_) for id_ in ids))
+        if len(ids) > max_ids:
+            raise ValidationError(
+                _("At most %(max_ids)s profiles can be read at once.", max_ids=max_ids),
+                "ids",
+            )
+
+        uuids = {}
+        for id_ in ids:
+            try:
+                uuids[id_] = UUID(id_)
+            except ValueError:
+                continue
+        model_cls = self.record_cls.model_cls
+        models = {}
+        if uuids:
+            query = model_cls.query.filter(
+                model_cls.id.in_(list(uuids.values())),
+                model_cls.is_deleted == False,  # noqa: E712
+            )
+            models = {model.id: model for model in query}
+
+        items, errors = [], []
+        for id_ in ids:
+            model = models.get(uuids.get(id_))
+            if model is None:
+                errors.append({"id": id_, "status": 404})
+                continue
+            record = self.record_cls(model.data, model=model)
+            # Checked once for all the profiles when it does not depend on them
+            if not check_permissions(self, identity, ("read",), record=record)[
+                "can_read"
+            ]:
+                errors.append({"id": id_, "status": 403})
+                continue
+            item = self.result_item(
+                self, identity, record, links_tpl=self.links_item_tpl
+            )
+            items.append(item.to_dict())
+        return FacultyProfileItems(self, identity, items, errors)
+
+    def import_many(self, identity, entries, chunk_size=None):
+        """Create faculty profiles in bulk.
+
+        Entries are validated and inserted in chunks of ``chunk_size``, each
+        chunk in its own transaction, and indexed through the bulk indexer.
+        Returns an iterator of one result per entry with the created ``id`` or
+        the ``errors`` that prevented its creation, without aborting the rest
+        of the chunk. Permissions are checked when called, not when iterated.
+        """
+        self.require_permission(identity, "create")
+        chunk_size = (
+            chunk_size or current_app.config["FACULTY_PROFILES_IMPORT_CHUNK_SIZE"]
+        )
+        return self._import_entries(identity, entries, chunk_size)
+
+    def _import_entries(self, identity, entries, chunk_size):
+        """Yield the results of an import, chunk after chunk."""
+        for chunk in chunked(enumerate(entries), chunk_size):
+            yield from self._import_chunk(identity, chunk)
+
     @unit_of_work()
     def update_photo(
         self, identity, id_, filename, stream, content_length=None, uow=None
@@ -54,28 +214,158 @@ class FacultyProfileService(RecordService):
         """Update the faculty profile's photo."""
         # get the file extesion from filename
         extension = self._get_file_extension(filename)
-        photo_size_limit = 10**6
-        max_size = current_app.config["FACULTY_PROFILES_PHOTO_MAX_FILE_SIZE"]
-        if type(max_size) is int and max_size > 0:
-            photo_size_limit = max_size
+        photo_size_limit, _ = get_file_size_limit("photo")
 
         if content_length and content_length > photo_size_limit:
             raise PhotoSizeLimitError(photo_size_limit, content_length)
 
-        return self._update_file(identity, id_, stream, "photo", extension, uow=uow)
+        try:
+            result = self._update_file(
+                identity,
+                id_,
+                stream,
+                "photo",
+                extension,
+                size_limit=photo_size_limit,
+                uow=uow,
+            )
+        except FileSizeError:
+            raise PhotoSizeLimitError(photo_size_limit)
+
+        uow.register(TaskOp(create_photo_renditions, str(id_)))
+        return result
 
     @unit_of_work()
     def update_cv(self, identity, id_, filename, stream, content_length=None, uow=None):
         """Update the faculty profile's cv."""
         # get the file extesion from filename
         extension = self._get_file_extension(filename)
-        return self._update_file(identity, id_, stream, "cv", extension, uow=uow)
+        cv_size_limit, _ = get_file_size_limit("cv")
+
+        if content_length and content_length > cv_size_limit:
+            raise CVSizeLimitError(cv_size_limit, content_length)
+
+        try:
+            return self._update_file(
+                identity,
+                id_,
+                stream,
+                "cv",
+                extension,
+                size_limit=cv_size_limit,
+                uow=uow,
+            )
+        except FileSizeError:
+            raise CVSizeLimitError(cv_size_limit)
+
+    @unit_of_work()
+    def init_file_transfer(
+        self, identity, id_, file_name, filename, transfer, size, uow=None
+    ):
+        """Start the transfer of the faculty profile's photo or cv.
+
+        ``transfer`` describes a transfer of one of the types allowed by
+        ``FACULTY_PROFILES_FILES_TRANSFER_TYPES``: a multipart upload, whose
+        parts are sent with ``set_file_transfer_part``, directly to the storage
+        when it provides part URLs, a file fetched from a URL, or a remote
+        file which downloads redirect to. The ``size`` of the file is required,
+        and checked against its size limit.
+
+        Remote files fill the slot right away. Multipart uploads fill it when
+        completed with ``commit_file_transfer``, fetched files when the fetch
+        task commits them. Photos cannot be remote files, as their renditions
+        are created from their content.
+        """
+        if (
+            transfer["type"]
+            not in current_app.config["FACULTY_PROFILES_FILES_TRANSFER_TYPES"]
+        ):
+            raise ValidationError(_("Transfer type not allowed."), "transfer_type")
+        if file_name == "photo" and transfer["type"] == REMOTE_TRANSFER_TYPE:
+            raise ValidationError(_("Photos cannot be remote files."), "transfer_type")
+
+        size_limit, error_cls = get_file_size_limit(file_name)
+        if size > size_limit:
+            raise error_cls(size_limit, size)
+
+        record = self.record_cls.pid.resolve(id_)
+        self.require_permission(identity, "update", record=record)
+
+        if record.attachments.get(file_name):
+            # Delete the current file, it is replaced by the transfer
+            self._remove_attachment(record, file_name)
+        for key in self._get_pending_file_keys(record, file_name):
+            # Drop the unfinished transfers of the slot
+            record.files.pop(key).delete(force=True)
+
+        extension = self._get_file_extension(filename)
+        file_key = f"{file_name}{extension}" if extension else file_name
+        result = self.files.init_files(
+            identity,
+            id_,
+            [{"key": file_key, "transfer": transfer, "size": size}],
+            uow=uow,
+        )
+        if transfer["type"] == REMOTE_TRANSFER_TYPE:
+            record.attachments.set(file_name, file_key)
+        uow.register(RecordCommitOp(record))
+        return result
+
+    @unit_of_work()
+    def set_file_transfer_part(
+        self, identity, id_, file_name, part, stream, content_length=None, uow=None
+    ):
+        """Upload one part of the faculty profile's photo or cv."""
+        file_key = self._get_pending_file_key(id_, file_name)
+        return self.files.set_multipart_file_content(
+            identity, id_, file_key, part, stream, content_length, uow=uow
+        )
+
+    @unit_of_work()
+    def commit_file_transfer(self, identity, id_, file_name, uow=None):
+        """Complete the multipart upload of the faculty profile's photo or cv."""
+        file_key = self._get_pending_file_key(id_, file_name)
+        return self.files.commit_file(identity, id_, file_key, uow=uow)
 
     @unit_of_work()
     def delete_photo(self, identity, id_, uow=None):
         """Delete the faculty profile's photo."""
         return self._delete_file(identity, id_, "photo", uow=uow)
 
+    @unit_of_work()
+    def create_photo_renditions(self, identity, id_, uow=None):
+        """Create the resized renditions of the faculty profile's photo.
+
+        Renditions are stored next to the photo, under ``photo-<size>`` keys.
+        Nothing is created if Pillow is not installed.
+        """
+        record = self.record_cls.pid.resolve(id_)
+        self.require_permission(identity, "update", record=record)
+
+        photo_key = record.attachments.get("photo")
+        if photo_key is None:
+            return
+
+        self._delete_photo_renditions(record)
+        uow.register(RecordCommitOp(record))
+
+        image_format = current_app.config["FACULTY_PROFILES_PHOTO_RENDITION_FORMAT"]
+        extension = PHOTO_RENDITION_EXTENSIONS[image_format]
+        for size in current_app.config["FACULTY_PROFILES_PHOTO_RENDITION_SIZES"]:
+            try:
+                with record.files[photo_key].open_stream("rb") as fp:
+                    rendition = make_image_rendition(fp, size, image_format)
+            except OSError:
+                current_app.logger.warning(f"Cannot create renditions of {photo_key}")
+                return
+            if rendition is None:
+                current_app.logger.warning(
+                    "Pillow is not installed, install the 'images' extra to "
+                    "create photo renditions."
+                )
+                return
+            record.files.create(f"photo-{size}{extension}", stream=rendition)
+
     @unit_of_work()
     def delete_cv(self, identity, id_, uow=None):
         """Delete the faculty profile's cv."""
@@ -91,22 +381,79 @@ class FacultyProfileService(RecordService):
             _, extension = os.path.splitext(filename)
         return extension
 
-    def _find_file_in_record(self, file_name, record):
-        """Find the file in the record."""
-        full_file_name = None
-        for key in record.files.keys():
-            prefix_to_check = f"{file_name}."
-            if key.startswith(prefix_to_check):
-                full_file_name = key
-                break
-        return full_file_name
+    @unit_of_work()
+    def _import_chunk(self, identity, chunk, uow=None):
+        """Create the records of one import chunk."""
+        results = []
+        records = []
+        for row, entry in chunk:
+            data, errors = self.schema.load(
+                entry, context={"identity": identity}, raise_errors=False
+            )
+            if errors:
+                results.append({"row": row, "id": None, "errors": errors})
+                continue
+
+            try:
+                with db.session.begin_nested():
+                    record = self.record_cls.create({})
+                    self.run_components(
+                        "create", identity, data=data, record=record, uow=uow
+                    )
+                    record.commit()
+            except (ValidationError, SchemaValidationError, IntegrityError) as ex:
+                results.append(
+                    {"row": row, "id": None, "errors": [{"messages": [str(ex)]}]}
+                )
+                continue
+
+            records.append(record)
+            results.append({"row": row, "id": str(record.id), "errors": []})
+
+        uow.register(RecordBulkIndexOp([r.id for r in records], self.indexer))
+        return results
+
+    def _remove_attachment(self, record, file_name):
+        """Delete the file held by a slot of the record and empty the slot."""
+        file_key = record.attachments.pop(file_name)
+        deleted_file = record.files.pop(file_key, None) if file_key else None
+        if deleted_file is None:
+            raise FileNotFoundError()
+
+        deleted_file.delete(force=True)
+        if file_name == "photo":
+            self._delete_photo_renditions(record)
+        return deleted_file
+
+    def _get_pending_file_keys(self, record, file_name):
+        """Get the keys of the files transferred to a slot, not yet in it."""
+        attached_key = record.attachments.get(file_name)
+        return [
+            key
+            for key in record.files.keys()
+            if key.split(".", 1)[0] == file_name and key != attached_key
+        ]
+
+    def _get_pending_file_key(self, id_, file_name):
+        """Get the key of the file being transferred to a slot."""
+        record = self.record_cls.pid.resolve(id_)
+        file_keys = self._get_pending_file_keys(record, file_name)
+        if not file_keys:
+            raise FileNotFoundError()
+        return file_keys[0]
+
+    def _delete_photo_renditions(self, record):
+        """Delete the renditions of the faculty profile's photo."""
+        for key in list(record.files.keys()):
+            if key.startswith("photo-"):
+                record.files.pop(key).delete(force=True)
 
     def _read_file(self, identity, file_name, id_):
         """Read the faculty profile file."""
         record = self.record_cls.pid.resolve(id_)
         self.require_permission(identity, "read", record=record)
-        full_file_name = self._find_file_in_record(file_name, record)
-        record_file = record.files.get(full_file_name)
+        full_file_name = record.attachments.get(file_name)
+        record_file = record.files.get(full_file_name) if full_file_name else None
         if record_file is None:
             raise FileNotFoundError()
         return self.files.file_result_item(
@@ -117,20 +464,122 @@ class FacultyProfileService(RecordService):
             links_tpl=self.files.file_links_item_tpl(id_),
         )
 
-    def _update_file(self, identity, id_, stream, file_name, file_extension, uow=None):
-        """Update a faculty profile's file."""
+    def _dump_profile(self, identity, record):
+        """Serialize a faculty profile for exports, without files and permissions."""
+        return self.schema.dump(
+            record,
+            schema_args={"exclude": ["files", "permissions"]},
+            context={"identity": identity, "record": record},
+        )
+
+    def _dump_change(self, identity, model, since):
+        """Serialize the change of a faculty profile in the change feed."""
+        change = {
+            "id": str(model.id),
+            "revision_id": model.version_id - 1,
+            "updated": model.updated.isoformat(),
+        }
+        if model.is_deleted:
+            change["operation"] = "deleted"
+        else:
+            is_new = since is None or model.created > since[0]
+            change["operation"] = "created" if is_new else "updated"
+            record = self.record_cls(model.data, model=model)
+            change["profile"] = self._dump_profile(identity, record)
+        return change
+
+    def _export_profiles(self, identity, updated_since, batch_size):
+        """Yield the serialized faculty profiles of an export."""
+        model_cls = self.record_cls.model_cls
+        query = model_cls.query.filter(model_cls.is_deleted == False)  # noqa: E712
+        if updated_since is not None:
+            query = query.filter(model_cls.updated >= updated_since)
+
+        last_id = None
+        while True:
+            batch_query = query
+            if last_id is not None:
+                batch_query = batch_query.filter(model_cls.id > last_id)
+            models = batch_query.order_by(model_cls.id).limit(batch_size).all()
+            if not models:
+                return
+
+            for model in models:
+                record = self.record_cls(model.data, model=model)
+                yield self._dump_profile(identity, record)
+                # Do not keep the exported rows in the session identity map
+                db.session.expunge(model)
+            last_id = models[-1].id
+
+    def _scan_pages(self, identity, search, params):
+        """Yield the hits of a search on a point in time, page after page.
+
+        The point in time is opened when the iteration starts, and closed when
+        it ends or is closed.
+        """
+        keep_alive = current_app.config["FACULTY_PROFILES_SCAN_KEEP_ALIVE"]
+        pit_id = current_search_client.create_pit(
+            index=build_alias_name(self.record_cls.index.search_alias),
+            keep_alive=keep_alive,
+        )["pit_id"]
+        try:
+            search_after = None
+            while True:
+                page = search.extra(pit={"id": pit_id, "keep_alive": keep_alive})
+                if search_after is not None:
+                    page = page.extra(search_after=search_after)
+                response = page.execute()
+                pit_id = getattr(response, "pit_id", pit_id)
+
+                yield from self.result_list(
+                    self,
+                    identity,
+                    response,
+                    params,
+                    links_item_tpl=self.links_item_tpl,
+                ).hits
+                if len(response.hits) < params["size"]:
+                    return
+                search_after = list(response.hits[-1].meta.sort)
+        finally:
+            current_search_client.delete_pit(body={"pit_id": [pit_id]})
+
+    def _update_file(
+        self,
+        identity,
+        id_,
+        stream,
+        file_name,
+        file_extension,
+        size_limit=None,
+        uow=None,
+    ):
+        """Update a faculty profile's file.
+
+        The stream is copied to storage in chunks of
+        ``FACULTY_PROFILES_UPLOAD_CHUNK_SIZE`` bytes, failing with
+        ``FileSizeError`` as soon as more than ``size_limit`` bytes are read.
+        """
         record = self.record_cls.pid.resolve(id_)
         self.require_permission(identity, "update", record=record)
 
         full_file_name = f"{file_name}{file_extension}" if file_extension else file_name
-        if (
-            record.files
-            and full_file_name not in record.files
-            and self._find_file_in_record(file_name, record)
-        ):
+        if record.attachments.get(file_name) not in (None, full_file_name):
             # Delete the old file of a different extension
-            self._delete_file(identity, id_, file_name, uow=uow)
-        record.files[full_file_name] = stream
+            self._remove_attachment(record, file_name)
+        elif file_name == "photo":
+            self._delete_photo_renditions(record)
+
+        file_args = {
+            "stream": stream,
+            "size_limit": size_limit,
+            "chunk_size": current_app.config["FACULTY_PROFILES_UPLOAD_CHUNK_SIZE"],
+        }
+        if full_file_name in record.files:
+            record.files.update(full_file_name, **file_args)
+        else:
+            record.files.create(full_file_name, **file_args)
+        record.attachments.set(file_name, full_file_name)
         uow.register(RecordCommitOp(record))
 
         return self.files.file_result_item(
@@ -147,13 +596,7 @@ class FacultyProfileService(RecordService):
         # update permission on community is required to be able to remove file.
         self.require_permission(identity, "update", record=record)
 
-        full_file_name = self._find_file_in_record(file_name, record)
-        deleted_file = record.files.pop(full_file_name, None)
-        if deleted_file is None:
-            raise FileNotFoundError()
-
-        deleted_file.delete(force=True)
-
+        deleted_file = self._remove_attachment(record, file_name)
         uow.register(RecordCommitOp(record))
 
         return self.files.file_result_item(
@@ -197,6 +640,266 @@ class FacultyProfileService(RecordService):
             else dsl.Q("match_none")
         )
 
+    def _setup_profile_query(self, record):
+        """Setup the query returning the faculty profiles of a record's creators."""
+        query_clauses = []
+        for creator in record.get("metadata", {}).get("creators", []):
+            person = creator.get("person_or_org", {})
+            identifiers = [i["identifier"] for i in person.get("identifiers", [])]
+            if identifiers:
+                query_clauses.append(
+                    dsl.Q("terms", **{"metadata.identifiers.identifier": identifiers})
+                )
+            # Candidates only, matched by profile_matches_creator afterwards
+            if person.get("family_name"):
+                must = [
+                    dsl.Q(
+                        "match_phrase",
+                        **{"metadata.family_name.suggest": person["family_name"]},
+                    )
+                ]
+                if person.get("given_name"):
+                    must.append(
+                        dsl.Q(
+                            "match_phrase",
+                            **{"metadata.given_names.suggest": person["given_name"]},
+                        )
+                    )
+                query_clauses.append(dsl.Q("bool", must=must))
+        # If no query clauses, return match_none
+        return (
+            dsl.Q("bool", should=query_clauses, minimum_should_match=1)
+            if query_clauses
+            else dsl.Q("match_none")
+        )
+
+    def _setup_attributed_record_query(self, record):
+        """Setup the record search extra query from the attributed records."""
+        record_ids = [
+            attribution.record_id
+            for attribution in FacultyProfileRecordModel.query.filter_by(
+                profile_id=record.id
+            )
+        ]
+        return dsl.Q("terms", id=record_ids) if record_ids else dsl.Q("match_none")
+
+    @unit_of_work()
+    def update_records_attribution(self, identity, id_, uow=None):
+        """Recompute the records attributed to a faculty profile."""
+        record = self.record_cls.pid.resolve(id_)
+        self.require_permission(identity, "update", record=record)
+
+        search = current_rdm_records_service.create_search(
+            identity,
+            current_rdm_records_service.record_cls,
+            current_rdm_records_service.config.search,
+            extra_filter=self._setup_record_query(record),
+        ).source(["id", "metadata.creators"])
+        metadata = record.get("metadata", {})
+        record_ids = {
+            hit["id"]
+            for hit in (hit.to_dict() for hit in search.scan())
+            if any(
+                profile_matches_creator(metadata, creator.get("person_or_org", {}))
+                for creator in hit.get("metadata", {}).get("creators", [])
+            )
+        }
+
+        FacultyProfileRecordModel.query.filter_by(profile_id=record.id).delete()
+        db.session.add_all(
+            FacultyProfileRecordModel(profile_id=record.id, record_id=record_id)
+            for record_id in record_ids
+        )
+        return record_ids
+
+    @unit_of_work()
+    def attribute_record(self, identity, record_id, uow=None):
+        """Attribute a published record to the faculty profiles of its creators."""
+        self.require_permission(identity, "update")
+        record = current_rdm_records_service.record_cls.pid.resolve(record_id)
+
+        search = self.create_search(
+            identity,
+            self.record_cls,
+            self.config.search,
+            extra_filter=self._setup_profile_query(record),
+        ).source(
+            ["metadata.family_name", "metadata.given_names", "metadata.identifiers"]
+        )
+        persons = [
+            creator.get("person_or_org", {})
+            for creator in record.get("metadata", {}).get("creators", [])
+        ]
+        profile_ids = {
+            hit.meta.id
+            for hit in search.scan()
+            if any(
+                profile_matches_creator(hit.to_dict().get("metadata", {}), person)
+                for person in persons
+            )
+        }
+
+        FacultyProfileRecordModel.query.filter_by(record_id=record_id).delete()
+        db.session.add_all(
+            FacultyProfileRecordModel(profile_id=profile_id, record_id=record_id)
+            for profile_id in profile_ids
+        )
+        return profile_ids
+
+    def scan_search(self, identity, params=None, **kwargs):
+        """Iterate over all the serialized faculty profiles matching a search.
+
+        The search runs on a point in time of the index and is paginated with
+        ``search_after``, so that it sees a consistent snapshot and the last
+        pages are as fast as the first ones. Permissions are checked when
+        called, the point in time is opened once the iteration starts.
+        """
+        self.require_permission(identity, "scan")
+
+        params = dict(params or {})
+        params.pop("cursor", None)
+        params.update(
+            page=1, size=current_app.config["FACULTY_PROFILES_SCAN_PAGE_SIZE"]
+        )
+        search = self._search("search", identity, params, None, **kwargs)
+        # Searches on a point in time must not target an index, and a page
+        # cut short by the search timeout must fail rather than skip hits
+        search = (
+            search.index()
+            .extra(track_total_hits=False)
+            .params(allow_partial_search_results=False)
+        )
+        return self._scan_pages(identity, search, params)
+
+    def search(
+        self, identity, params=None, search_preference=None, expand=False, **kwargs
+    ):
+        """Search for faculty profiles matching the querystring.
+
+        Identical searches share their response through the search cache.
+        """
+        self.require_permission(identity, "search")
+
+        params = params or {}
+        search = self._search("search", identity, params, search_preference, **kwargs)
+        search_result = execute_search(search)
+
+        return self.result_list(
+            self,
+            identity,
+            search_result,
+            params,
+            links_tpl=LinksTemplate(self.config.links_search, context={"args": params}),
+            links_item_tpl=self.links_item_tpl,
+            expandable_fields=self.expandable_fields,
+            expand=expand,
+        )
+
+    def suggest(self, identity, q, size=None):
+        """Suggest the faculty profiles whose names start like a query.
+
+        The query is matched as prefixes of the words of the names,
+        departments and institutions, on their ``search_as_you_type``
+        subfields, and only the fields of the suggestions are fetched.
+        Suggestions are filtered by the query filters of both the ``read`` and
+        the ``search`` permissions.
+        """
+        self.require_permission(identity, "search")
+        search_permission = self.permission_policy("search", identity=identity)
+
+        size = size or current_app.config["FACULTY_PROFILES_SUGGEST_SIZE"]
+        fields = []
+        for field in current_app.config["FACULTY_PROFILES_SUGGEST_FIELDS"]:
+            name, _, boost = field.partition("^")
+            boost = f"^{boost}" if boost else ""
+            fields += [
+                f"{name}{boost}",
+                f"{name}._2gram{boost}",
+                f"{name}._3gram{boost}",
+            ]
+
+        search = (
+            self.create_search(
+                identity,
+                self.record_cls,
+                self.config.search,
+                extra_filter=permission_filter(search_permission),
+            )
+            .query(dsl.Q("multi_match", query=q, type="bool_prefix", fields=fields))
+            .source(
+                [
+                    "id",
+                    "metadata.given_names",
+                    "metadata.family_name",
+                    "metadata.department",
+                    "metadata.institution",
+                    "attachments",
+                ]
+            )
+            .extra(size=size, track_total_hits=False)
+        )
+        return FacultyProfileSuggestions(
+            self,
+            identity,
+            search.execute(),
+            links_item_tpl=LinksTemplate(self.config.links_suggestion),
+        )
+
+    def export(self, identity, updated_since=None, batch_size=None):
+        """Iterate over all the serialized faculty profiles, from the database.
+
+        The profiles are read in batches of ``batch_size`` rows, paginated on
+        their primary key, and dumped one at a time, so that the export never
+        holds more than a batch in memory. With ``updated_since``, only the
+        profiles updated since then are exported.
+        """
+        self.require_permission(identity, "export")
+
+        if updated_since is not None and updated_since.tzinfo is not None:
+            updated_since = updated_since.astimezone(timezone.utc).replace(tzinfo=None)
+        batch_size = (
+            batch_size or current_app.config["FACULTY_PROFILES_EXPORT_BATCH_SIZE"]
+        )
+        return self._export_profiles(identity, updated_since, batch_size)
+
+    def read_changes(self, identity, since=None, size=None):
+        """Read the faculty profiles created, updated or deleted since a token.
+
+        Changes are returned in ``(updated, id)`` order, deleted profiles as
+        tombstones, along with the token to pass as ``since`` to get the next
+        ones. The changes of the last seconds, set by
+        ``FACULTY_PROFILES_CHANGES_DELAY``, are held back, so that rows of
+        transactions still in flight do not end up behind the token.
+        """
+        self.require_permission(identity, "export")
+
+        since = decode_change_token(since) if since else None
+        size = size or current_app.config["FACULTY_PROFILES_CHANGES_PAGE_SIZE"]
+        until = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            seconds=current_app.config["FACULTY_PROFILES_CHANGES_DELAY"]
+        )
+
+        model_cls = self.record_cls.model_cls
+        query = model_cls.query.filter(model_cls.updated < until)
+        if since is not None:
+            query = query.filter(db.tuple_(model_cls.updated, model_cls.id) > since)
+        models = query.order_by(model_cls.updated, model_cls.id).limit(size).all()
+
+        changes = [self._dump_change(identity, model, since) for model in models]
+        if models:
+            next_since = encode_change_token(models[-1].updated, models[-1].id)
+        else:
+            next_since = encode_change_token(*since) if since else None
+        return FacultyProfileChanges(
+            self,
+            identity,
+            changes,
+            next_since,
+            links_tpl=LinksTemplate(
+                self.config.links_changes, context={"args": {"size": size}}
+            ),
+        )
+
     def search_records(
         self,
         identity,
@@ -213,11 +916,16 @@ class FacultyProfileService(RecordService):
 
         params = params or {}
 
+        if current_app.config["FACULTY_PROFILES_RECORDS_ATTRIBUTION_ENABLED"]:
+            extra_filter = self._setup_attributed_record_query(record)
+        else:
+            extra_filter = self._setup_record_query(record)
+
         return current_rdm_records_service.search(
             identity,
             params=params,
             search_preference=search_preference,
             expand=expand,
-            extra_filter=self._setup_record_query(record),
+            extra_filter=extra_filter,
             **kwargs,
         )
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Celery tasks for faculty profiles."""
+
+from celery import shared_task
+from flask import current_app
+from invenio_access.permissions import system_identity
+
+from .proxies import current_profiles_service
+
+
+@shared_task(ignore_result=True)
+def update_records_attribution(profile_id):
+    """Recompute the records attributed to a faculty profile."""
+    current_profiles_service.update_records_attribution(system_identity, profile_id)
+
+
+@shared_task(ignore_result=True)
+def attribute_record(record_id):
+    """Attribute a published record to the faculty profiles of its creators."""
+    current_profiles_service.attribute_record(system_identity, record_id)
+
+
+@shared_task(ignore_result=True)
+def create_photo_renditions(profile_id):
+    """Create the resized renditions of a faculty profile's photo."""
+    current_profiles_service.create_photo_renditions(system_identity, profile_id)
+
+
+@shared_task(ignore_result=True)
+def process_index_queue():
+    """Index the faculty profiles queued for indexing, until the queue is empty.
+
+    Returns the number of successful and failed index actions.
+    """
+    indexer = current_profiles_service.indexer
+    batch_size = current_app.config["FACULTY_PROFILES_INDEXER_BATCH_SIZE"]
+    indexed = failed = 0
+    while True:
+        success, errors = indexer.process_bulk_queue(bulk_index_max_items=batch_size)
+        if not success and not errors:
+            return indexed, failed
+        indexed, failed = indexed + success, failed + errors
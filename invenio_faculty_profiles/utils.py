@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Utilities for faculty profiles."""
+
+import json
+import re
+import time
+from functools import lru_cache
+from io import BytesIO
+from itertools import islice
+
+import phonenumbers
+from flask import current_app
+from invenio_i18n import get_locale
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+_JSON_SEPARATORS = " \t\r\n,"
+
+
+def chunked(iterable, size):
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_json_entries(fp, read_size=2**16):
+    """Yield the objects of a JSON array or a JSON lines stream.
+
+    The input is read in blocks of ``read_size`` characters, so that only the
+    entry being decoded is kept in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+    in_array = None
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _JSON_SEPARATORS:
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                return
+            buffer, pos = fp.read(read_size), 0
+            eof = not buffer
+            continue
+
+        if in_array is None:
+            in_array = buffer[pos] == "["
+            if in_array:
+                pos += 1
+                continue
+        if in_array and buffer[pos] == "]":
+            return
+
+        try:
+            entry, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            data = fp.read(read_size)
+            buffer, pos = buffer[pos:] + data, 0
+            eof = not data
+            continue
+        yield entry
+
+
+class TTLCache:
+    """Process-local cache whose entries expire after a time-to-live."""
+
+    def __init__(self):
+        """Constructor."""
+        self._entries = {}
+
+    def get(self, key, factory, ttl):
+        """Get the value of ``key``, computing it with ``factory`` if expired."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = factory()
+        self._entries[key] = (now + ttl, value)
+        return value
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+
+
+def normalize_person_name(name):
+    """Normalize a person name to its lower case words, in order."""
+    return " ".join(re.findall(r"\w+", name.casefold())) if name else ""
+
+
+def profile_matches_creator(metadata, person):
+    """Tell if a faculty profile is the person of a record's creator.
+
+    They match when they share an identifier, or when the "Family, Given"
+    name of the profile is the name of the creator, compared word by word
+    ignoring case and punctuation. This is the one attribution rule: the
+    searches of records and profiles only preselect candidates for it.
+    """
+    profile_identifiers = {i.get("identifier") for i in metadata.get("identifiers", [])}
+    person_identifiers = {i.get("identifier") for i in person.get("identifiers", [])}
+    if (profile_identifiers & person_identifiers) - {None}:
+        return True
+
+    if not metadata.get("family_name"):
+        return False
+    profile_name = f"{metadata['family_name']}, {metadata.get('given_names') or ''}"
+    person_name = person.get("name") or ", ".join(
+        filter(None, [person.get("family_name"), person.get("given_name")])
+    )
+    return normalize_person_name(profile_name) == normalize_person_name(person_name)
+
+
+def profile_page_version_key(profile_id):
+    """Get the cache key of the version token of a faculty profile's pages."""
+    return f"faculty_profiles:page_version:{profile_id}"
+
+
+def make_image_rendition(fp, size, image_format):
+    """Create a rendition of the image in ``fp`` fitting a ``size`` pixels box.
+
+    Returns a stream with the image encoded as ``image_format``, or ``None``
+    if Pillow is not installed.
+    """
+    if Image is None:
+        return None
+
+    with Image.open(fp) as image:
+        image.draft("RGB", (size, size))
+        rendition = ImageOps.exif_transpose(image)
+        rendition.thumbnail((size, size))
+
+    if image_format == "JPEG":
+        rendition = rendition.convert("RGB")
+    elif rendition.mode not in ("RGB", "RGBA"):
+        rendition = rendition.convert("RGBA")
+
+    stream = BytesIO()
+    rendition.save(stream, format=image_format)
+    stream.seek(0)
+    return stream
+
+
+def telephone_region():
+    """Get the region of the phone numbers written without a country code.
+
+    ``FACULTY_PROFILES_TELEPHONE_REGION`` if set, else the territory of the
+    current locale, else ``US``.
+    """
+    region = current_app.config["FACULTY_PROFILES_TELEPHONE_REGION"]
+    if region:
+        return region
+    locale = get_locale()
+    return getattr(locale, "territory", None) or "US"
+
+
+@lru_cache(maxsize=4096)
+def normalize_telephone(value, region):
+    """Get the E.164 form of a phone number, or ``None`` if it is not valid."""
+    try:
+        number = phonenumbers.parse(value, region)
+    except phonenumbers.NumberParseException:
+        return None
+    if not phonenumbers.is_valid_number(number):
+        return None
+    return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.E164)
@@ -10,25 +10,42 @@
 """Decorators."""
 
 from functools import wraps
+from uuid import UUID, uuid4
 
-from flask import g, request
+from flask import current_app, g, request, session
+from flask_login import current_user
+from invenio_cache import current_cache
+from invenio_i18n import get_locale
 
 from invenio_faculty_profiles.proxies import current_profiles
 from invenio_faculty_profiles.resources.serializer import (
     UIFacultyProfileJSONSerializer,
 )
+from invenio_faculty_profiles.utils import profile_page_version_key
 
 
-def pass_faculty_profile(serialize):
-    """Fetch the faculty profile record."""
+def pass_faculty_profile(serialize, permissions=None):
+    """Fetch the faculty profile record.
+
+    When ``permissions`` are given, the view also receives the ``permissions``
+    of the current identity for those actions and the ``attachments`` summary
+    of the profile, computed from the same read.
+    """
 
     def decorator(f):
         @wraps(f)
         def view(**kwargs):
             pid_value = kwargs["pid_value"]
-            faculty_profile = current_profiles.records_service.read(
-                id_=pid_value, identity=g.identity
-            )
+            if permissions is None:
+                faculty_profile = current_profiles.records_service.read(
+                    id_=pid_value, identity=g.identity
+                )
+            else:
+                faculty_profile, kwargs["permissions"], kwargs["attachments"] = (
+                    current_profiles.records_service.read_with_attachments(
+                        g.identity, pid_value, actions=permissions
+                    )
+                )
             kwargs["faculty_profile"] = faculty_profile
             request.faculty_profile = faculty_profile.to_dict()
             if serialize:
@@ -40,3 +57,46 @@ def pass_faculty_profile(serialize):
         return view
 
     return decorator
+
+
+def cached_profile_page(f):
+    """Cache the page of a faculty profile rendered for anonymous users.
+
+    Pages are cached per profile, locale and version token for
+    ``FACULTY_PROFILES_PAGE_CACHE_TIMEOUT`` seconds. The version token of a
+    profile is dropped when a change to the profile or its files is committed,
+    so that the pages cached before are not served anymore. The token is read
+    before the profile, thus a page never outlives a change committed while
+    it was rendered.
+    """
+
+    @wraps(f)
+    def view(**kwargs):
+        timeout = current_app.config["FACULTY_PROFILES_PAGE_CACHE_TIMEOUT"]
+        if not timeout or current_user.is_authenticated or session.get("_flashes"):
+            return f(**kwargs)
+        try:
+            profile_id = str(UUID(kwargs["pid_value"]))
+        except ValueError:
+            return f(**kwargs)
+
+        version_key = profile_page_version_key(profile_id)
+        version = current_cache.get(version_key)
+        if version is None:
+            version = uuid4().hex
+            if not current_cache.add(version_key, version, timeout=timeout):
+                version = current_cache.get(version_key)
+        if version is None:
+            return f(**kwargs)
+
+        page_key = (
+            f"faculty_profiles:page:{profile_id}:{version}:{get_locale()}:anonymous"
+        )
+        page = current_cache.get(page_key)
+        if page is None:
+            page = f(**kwargs)
+            if isinstance(page, str):
+                current_cache.set(page_key, page, timeout=timeout)
+        return page
+
+    return view
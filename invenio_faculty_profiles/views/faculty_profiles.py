@@ -10,13 +10,14 @@
 
 from flask import current_app, g, render_template
 from flask_login import login_required
+from invenio_i18n import get_locale
 from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_vocabularies.proxies import current_service as vocabulary_service
 
 from invenio_faculty_profiles.resources.ui_schema import TypesSchema
 
 from ..proxies import current_profiles
-from .decorators import pass_faculty_profile
+from .decorators import cached_profile_page, pass_faculty_profile
 
 HEADER_PERMISSIONS = {
     "read",
@@ -47,7 +48,7 @@ def faculty_profiles_frontpage():
     )
 
 
-def _profile_serialized_types():
+def _read_profile_serialized_types():
     _types = vocabulary_service.read_all(
         g.identity,
         fields=["id", "title"],
@@ -60,6 +61,15 @@ def _profile_serialized_types():
     return TypesSchema().dump(types_json)
 
 
+def _profile_serialized_types():
+    # Titles are localized by the schema, hence cached per locale.
+    return current_profiles.profile_types_cache.get(
+        str(get_locale()),
+        _read_profile_serialized_types,
+        current_app.config["FACULTY_PROFILES_TYPES_CACHE_TTL"],
+    )
+
+
 @login_required
 def faculty_profiles_new():
     """Faculty Profiles creation page."""
@@ -84,26 +94,15 @@ def faculty_profiles_new():
     )
 
 
-@pass_faculty_profile(serialize=True)
-def faculty_profiles_edit(pid_value, faculty_profile, faculty_profile_ui):
+@pass_faculty_profile(serialize=True, permissions=PRIVATE_PERMISSIONS)
+def faculty_profiles_edit(
+    pid_value, faculty_profile, faculty_profile_ui, permissions, attachments
+):
     """Community settings/profile page."""
     # Permissions are for checking for deletion or other custom permissions.
-    permissions = faculty_profile.has_permissions_to(PRIVATE_PERMISSIONS)
     if not permissions["can_update"]:
         raise PermissionDeniedError()
 
-    try:
-        current_profiles.records_service.read_photo(g.identity, pid_value)
-        photo = True
-    except FileNotFoundError:
-        photo = False
-
-    try:
-        current_profiles.records_service.read_cv(g.identity, pid_value)
-        cv = True
-    except FileNotFoundError:
-        cv = False
-
     types_serialized = _profile_serialized_types()
 
     photo_size_limit = 10**6
@@ -115,19 +114,21 @@ def faculty_profiles_edit(pid_value, faculty_profile, faculty_profile_ui):
         "invenio_faculty_profiles/edit.html",
         faculty_profile=faculty_profile,
         faculty_profile_ui=faculty_profile_ui,
-        has_photo=True if photo else False,
-        has_cv=True if cv else False,
+        has_photo=attachments["photo"],
+        has_cv=attachments["cv"],
         photo_quota=photo_size_limit,
         permissions=permissions,
         types=types_serialized["types"],
     )
 
 
-@pass_faculty_profile(serialize=True)
-def faculty_profile_detail(pid_value, faculty_profile, faculty_profile_ui):
+@cached_profile_page
+@pass_faculty_profile(serialize=True, permissions=PRIVATE_PERMISSIONS)
+def faculty_profile_detail(
+    pid_value, faculty_profile, faculty_profile_ui, permissions, attachments
+):
     """Faculty Profile detail page."""
     # Permissions are for checking for deletion or other custom permissions.
-    permissions = faculty_profile.has_permissions_to(PRIVATE_PERMISSIONS)
     if not permissions["can_read"]:
         raise PermissionDeniedError()
 
@@ -135,5 +136,7 @@ def faculty_profile_detail(pid_value, faculty_profile, faculty_profile_ui):
         "invenio_faculty_profiles/detail.html",
         faculty_profile=faculty_profile,
         faculty_profile_ui=faculty_profile_ui,
+        has_photo=attachments["photo"],
+        has_cv=attachments["cv"],
         permissions=permissions,
     )
@@ -15,9 +15,9 @@ from babel.dates import format_datetime
 from flask import Blueprint, current_app, g, render_template, url_for
 from flask_login import current_user
 from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_records_resources.proxies import current_service_registry
 from invenio_records_resources.services.errors import PermissionDeniedError
 
+from ..proxies import current_profiles_service
 from ..searchapp import search_app_context
 from .faculty_profiles import (
     faculty_profile_detail,
@@ -44,6 +44,34 @@ def record_permission_denied_error(error):
     return render_template(current_app.config["THEME_403_TEMPLATE"]), 403
 
 
+#
+# Helpers
+#
+def faculty_profile_has_photo(faculty_profile):
+    """Check if a faculty profile has a photo.
+
+    The decision is taken from the ``attachments`` of the serialized profile
+    (a result item or its dictionary). When only the profile id is given, the
+    photo is looked up once per request and the answer cached.
+    """
+    data = getattr(faculty_profile, "data", faculty_profile)
+    if isinstance(data, dict):
+        attachments = data.get("attachments")
+        if attachments is not None:
+            return "photo" in attachments
+        faculty_profile = data["id"]
+
+    cache = g.setdefault("faculty_profiles_has_photo", {})
+    faculty_profile_id = str(faculty_profile)
+    if faculty_profile_id not in cache:
+        try:
+            current_profiles_service.read_photo(g.identity, faculty_profile_id)
+            cache[faculty_profile_id] = True
+        except FileNotFoundError:
+            cache[faculty_profile_id] = False
+    return cache[faculty_profile_id]
+
+
 #
 # Registration
 #
@@ -94,8 +122,8 @@ def create_ui_blueprint(app):
 
     blueprint.register_error_handler(PIDDoesNotExistError, not_found_error)
 
-    # Register context processor
-    blueprint.app_context_processor(search_app_context)
+    # Register context processor, for the templates of the blueprint only
+    blueprint.context_processor(search_app_context)
 
     # Template filters
     @blueprint.app_template_filter()
@@ -105,16 +133,9 @@ def create_ui_blueprint(app):
         return format_datetime(date, locale=locale_value)
 
     @blueprint.app_template_filter("resolve_faculty_profile_photo")
-    def resolve_faculty_profile_photo(photo_link, faculty_profile_id):
+    def resolve_faculty_profile_photo(photo_link, faculty_profile):
         """Returns placeholder image link if passed faculty profile doesn't have a photo."""
-        faculty_profile_service = current_service_registry.get("facultyprofiles")
-
-        try:
-            faculty_profile_service.read_photo(
-                identity=g.identity,
-                id_=faculty_profile_id,
-            )
-        except FileNotFoundError:
+        if not faculty_profile_has_photo(faculty_profile):
             return url_for("static", filename="images/square-placeholder.png")
 
         return photo_link
@@ -9,6 +9,10 @@
 
 """Pytest configuration."""
 
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
 import pytest
 from flask_principal import Identity, Need, UserNeed
 from flask_security import login_user
@@ -18,12 +22,15 @@ from invenio_accounts.testutils import login_user_via_session
 from invenio_administration.permissions import administration_access_action
 from invenio_app.factory import create_api
 from invenio_cache.proxies import current_cache
+from invenio_rdm_records.records.api import RDMRecord
+from invenio_search import current_search, current_search_client
 from invenio_users_resources.proxies import current_users_service
 from invenio_users_resources.services.schemas import (
     NotificationPreferences,
     UserPreferencesSchema,
 )
 from marshmallow import fields
+from sqlalchemy import event
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.schema import DropConstraint, DropSequence, DropTable
 
@@ -31,6 +38,18 @@ from invenio_faculty_profiles.records.api import FacultyProfile
 
 pytest_plugins = ("celery.contrib.pytest",)
 
+QUERY_BUDGETS_PATH = Path(__file__).parent / "query_budgets.json"
+
+
+def pytest_addoption(parser):
+    """Add the option to record the query budgets of the benchmarks."""
+    parser.addoption(
+        "--update-query-budgets",
+        action="store_true",
+        help="Record the SQL queries and search requests of the benchmarks "
+        f"as their budgets, in {QUERY_BUDGETS_PATH.name}.",
+    )
+
 
 @compiles(DropTable, "postgresql")
 def _compile_drop_table(element, compiler, **kwargs):
@@ -116,6 +135,16 @@ def search_clear(search):
     _search_create_indexes(current_search, current_search_client)
 
 
+@pytest.fixture()
+def rdm_records_index(search):
+    """Create the index of the RDM records, searched by the profiles service."""
+    index_list = [RDMRecord.index._name]
+    list(current_search.create(ignore_existing=True, index_list=index_list))
+    RDMRecord.index.refresh()
+    yield
+    list(current_search.delete(index_list=index_list))
+
+
 @pytest.fixture(scope="module")
 def testapp(base_app, database):
     """Application with just a database.
@@ -270,3 +299,77 @@ def headers():
         "content-type": "application/json",
         "accept": "application/json",
     }
+
+
+@pytest.fixture(scope="session")
+def query_budgets(request):
+    """Budgets of SQL queries and search requests, per operation.
+
+    Operations are recorded with ``--update-query-budgets`` only, the budgets
+    file is then written back at the end of the session.
+    """
+    budgets = {}
+    if QUERY_BUDGETS_PATH.exists():
+        budgets = json.loads(QUERY_BUDGETS_PATH.read_text())
+    recorded = {}
+    yield budgets, recorded
+
+    if recorded:
+        budgets.update(recorded)
+        QUERY_BUDGETS_PATH.write_text(
+            json.dumps(dict(sorted(budgets.items())), indent=2) + "\n"
+        )
+
+
+@pytest.fixture()
+def query_budget(request, db, query_budgets):
+    """Count the SQL queries and search requests of an operation.
+
+    Fails when they exceed the budget recorded for the operation, or when it
+    has no budget, e.g.:
+
+    .. code-block:: python
+
+        with query_budget("service.read"):
+            current_profiles_service.read(system_identity, id_)
+    """
+    budgets, recorded = query_budgets
+    update = request.config.getoption("--update-query-budgets")
+
+    @contextmanager
+    def check(name):
+        counts = {"sql": 0, "search": 0}
+
+        def count_sql(*args, **kwargs):
+            counts["sql"] += 1
+
+        transport = current_search_client.transport
+        perform_request = transport.perform_request
+
+        def count_search(*args, **kwargs):
+            counts["search"] += 1
+            return perform_request(*args, **kwargs)
+
+        event.listen(db.engine, "before_cursor_execute", count_sql)
+        transport.perform_request = count_search
+        try:
+            yield counts
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count_sql)
+            del transport.perform_request
+
+        if update:
+            recorded[name] = counts
+            return
+        budget = budgets.get(name)
+        assert (
+            budget is not None
+        ), f"{name} has no query budget, record it with --update-query-budgets."
+        for kind in ("sql", "search"):
+            assert counts[kind] <= budget[kind], (
+                f"{name} ran {counts[kind]} {kind} queries, over its budget of "
+                f"{budget[kind]}. Fix the regression, or record the new budget "
+                "with --update-query-budgets."
+            )
+
+    return check
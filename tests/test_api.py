@@ -9,9 +9,11 @@
 """Test low level API."""
 
 import pytest
+from invenio_records.signals import after_record_update
 from jsonschema import ValidationError
 
-from invenio_faculty_profiles.records.api import FacultyProfile
+from invenio_faculty_profiles.ext import FacultyProfileExtension
+from invenio_faculty_profiles.records.api import FacultyProfile, resolver_cache_stats
 
 
 def test_api_create(app, db, employee_profile_data, location):
@@ -34,3 +36,30 @@ def test_wrong_metadata(app, db):
     """Test wrong metadata."""
     with pytest.raises(ValidationError):
         FacultyProfile.create(data={"gabage": {"foo": 1}})
+
+
+def test_resolver_cache(app, db, employee_profile_data, location):
+    """Test the request-scoped cache of the record resolver."""
+    profile = FacultyProfile.create(data=employee_profile_data)
+    profile.commit()
+    db.session.commit()
+    hits, misses = resolver_cache_stats["hits"], resolver_cache_stats["misses"]
+
+    with app.test_request_context():
+        resolved = FacultyProfile.pid.resolve(str(profile.id))
+        assert FacultyProfile.pid.resolve(str(profile.id)) is resolved
+        assert resolver_cache_stats["hits"] == hits + 1
+        assert resolver_cache_stats["misses"] == misses + 1
+
+        db.session.commit()
+        assert FacultyProfile.pid.resolve(str(profile.id)) is not resolved
+        assert resolver_cache_stats["misses"] == misses + 2
+
+
+def test_signal_receivers(app):
+    """Test that the signal receivers are connected once for all the apps."""
+    extension = app.extensions["invenio-faculty-profiles"]
+    receivers = len(after_record_update.receivers)
+    extension.init_caches()
+    FacultyProfileExtension().init_caches()
+    assert len(after_record_update.receivers) == receivers
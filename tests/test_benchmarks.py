@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks of the service, resource and UI hot paths.
+
+Each benchmark also checks the SQL queries and search requests of one run
+against its budget in ``query_budgets.json``. Record new budgets with
+``pytest tests/test_benchmarks.py --update-query-budgets``.
+"""
+
+from copy import deepcopy
+from io import BytesIO
+
+import pytest
+from flask import g
+from flask_login import login_user
+from invenio_access.permissions import system_identity
+
+from invenio_faculty_profiles.proxies import current_profiles_service
+from invenio_faculty_profiles.records.api import FacultyProfile
+from invenio_faculty_profiles.views import faculty_profiles as views
+
+ROUNDS = 10
+
+
+@pytest.fixture()
+def render_template(monkeypatch):
+    """Skip the rendering of the UI templates, not part of the API app."""
+    rendered = []
+
+    def render(template, **context):
+        rendered.append(template)
+        return template
+
+    monkeypatch.setattr(views, "render_template", render)
+    return rendered
+
+
+def create_profiles(data, count):
+    """Create ``count`` indexed faculty profiles."""
+    results = list(
+        current_profiles_service.import_many(system_identity, [data] * count)
+    )
+    current_profiles_service.indexer.process_bulk_queue()
+    FacultyProfile.index.refresh()
+    return [r["id"] for r in results]
+
+
+def test_service_create(
+    app, db, search_clear, employee_profile_data, benchmark, query_budget
+):
+    """Benchmark the creation of a faculty profile."""
+    with query_budget("service.create"):
+        current_profiles_service.create(system_identity, employee_profile_data)
+
+    benchmark.pedantic(
+        current_profiles_service.create,
+        args=(system_identity, employee_profile_data),
+        rounds=ROUNDS,
+    )
+
+
+def test_service_read(
+    app, db, search_clear, employee_profile_data, benchmark, query_budget
+):
+    """Benchmark the read of a faculty profile."""
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+
+    def read():
+        return current_profiles_service.read(system_identity, profile.id).to_dict()
+
+    with query_budget("service.read"):
+        read()
+
+    benchmark.pedantic(read, rounds=ROUNDS)
+
+
+def test_service_update(
+    app, db, search_clear, employee_profile_data, benchmark, query_budget
+):
+    """Benchmark the update of a faculty profile."""
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+    data = deepcopy(employee_profile_data)
+    data["metadata"]["family_name"] = "Smith"
+
+    with query_budget("service.update"):
+        current_profiles_service.update(system_identity, profile.id, data)
+
+    benchmark.pedantic(
+        current_profiles_service.update,
+        args=(system_identity, profile.id, data),
+        rounds=ROUNDS,
+    )
+
+
+@pytest.mark.parametrize("size", [20, 100])
+def test_service_search(
+    app, db, search_clear, employee_profile_data, benchmark, query_budget, size
+):
+    """Benchmark a search of faculty profiles, per page size."""
+    create_profiles(employee_profile_data, size)
+
+    def search():
+        return current_profiles_service.search(
+            system_identity, params={"size": size}
+        ).to_dict()
+
+    with query_budget(f"service.search[{size}]"):
+        result = search()
+    assert len(result["hits"]["hits"]) == size
+
+    benchmark.pedantic(search, rounds=ROUNDS)
+
+
+def test_service_search_facets(
+    app, db, search_clear, employee_profile_data, benchmark, query_budget
+):
+    """Benchmark a search of faculty profiles filtered by a facet."""
+    create_profiles(employee_profile_data, 20)
+
+    def search():
+        return current_profiles_service.search(
+            system_identity, params={"size": 20, "facets": {"type": ["employee"]}}
+        ).to_dict()
+
+    with query_budget("service.search_facets"):
+        result = search()
+    assert "type" in result["aggregations"]
+
+    benchmark.pedantic(search, rounds=ROUNDS)
+
+
+@pytest.mark.parametrize("size", [20, 100])
+def test_service_search_permissions(
+    app,
+    db,
+    search_clear,
+    users,
+    identity_simple,
+    employee_profile_data,
+    benchmark,
+    query_budget,
+    size,
+):
+    """Benchmark the serialization of the permissions of the search hits."""
+    create_profiles(employee_profile_data, size)
+    result = current_profiles_service.search(identity_simple, params={"size": size})
+
+    with query_budget(f"service.search_permissions[{size}]"):
+        hits = result.to_dict()["hits"]["hits"]
+    assert len(hits) == size
+    assert all("permissions" in hit for hit in hits)
+
+    benchmark.pedantic(result.to_dict, rounds=ROUNDS)
+
+
+def test_service_search_records(
+    app,
+    db,
+    search_clear,
+    rdm_records_index,
+    employee_profile_data,
+    benchmark,
+    query_budget,
+):
+    """Benchmark the search of the records of a faculty profile."""
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+
+    def search_records():
+        return current_profiles_service.search_records(
+            system_identity, profile.id, params={"size": 20}
+        ).to_dict()
+
+    with query_budget("service.search_records"):
+        search_records()
+
+    benchmark.pedantic(search_records, rounds=ROUNDS)
+
+
+def test_service_photo_upload(
+    app, db, search_clear, location, employee_profile_data, benchmark, query_budget
+):
+    """Benchmark the upload of a faculty profile's photo."""
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+
+    def upload():
+        return current_profiles_service.update_photo(
+            system_identity, profile.id, "photo.jpg", BytesIO(b"photo")
+        )
+
+    with query_budget("service.update_photo"):
+        upload()
+
+    benchmark.pedantic(upload, rounds=ROUNDS)
+
+
+def test_resource_read(
+    app, db, search_clear, employee_profile_data, admin_client, benchmark, query_budget
+):
+    """Benchmark the read of a faculty profile through the REST API."""
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+
+    def read():
+        res = admin_client.get(f"/faculty-profiles/{profile.id}")
+        assert res.status_code == 200
+
+    with query_budget("resource.read"):
+        read()
+
+    benchmark.pedantic(read, rounds=ROUNDS)
+
+
+def test_resource_read_photo(
+    app,
+    db,
+    search_clear,
+    location,
+    employee_profile_data,
+    admin_client,
+    benchmark,
+    query_budget,
+):
+    """Benchmark the download of a faculty profile's photo."""
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+    current_profiles_service.update_photo(
+        system_identity, profile.id, "photo.jpg", BytesIO(b"photo")
+    )
+
+    def read_photo():
+        res = admin_client.get(f"/faculty-profiles/{profile.id}/photo")
+        assert res.status_code in (200, 302)
+
+    with query_budget("resource.read_photo"):
+        read_photo()
+
+    benchmark.pedantic(read_photo, rounds=ROUNDS)
+
+
+def test_view_detail(
+    app,
+    db,
+    search_clear,
+    employee_profile_data,
+    render_template,
+    benchmark,
+    query_budget,
+    monkeypatch,
+):
+    """Benchmark the rendering of the faculty profile page."""
+    # Render the page on every run, not once
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_PAGE_CACHE_TIMEOUT", None)
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+
+    def detail():
+        with app.test_request_context():
+            g.identity = system_identity
+            return views.faculty_profile_detail(pid_value=profile.id)
+
+    with query_budget("view.detail"):
+        assert detail() == "invenio_faculty_profiles/detail.html"
+
+    benchmark.pedantic(detail, rounds=ROUNDS)
+
+
+def test_view_edit(
+    app,
+    db,
+    search_clear,
+    users,
+    employee_profile_data,
+    render_template,
+    benchmark,
+    query_budget,
+):
+    """Benchmark the rendering of the faculty profile edit page."""
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+
+    def edit():
+        with app.test_request_context():
+            login_user(users[0].user)
+            g.identity = system_identity
+            return views.faculty_profiles_edit(pid_value=profile.id)
+
+    with query_budget("view.edit"):
+        assert edit() == "invenio_faculty_profiles/edit.html"
+
+    benchmark.pedantic(edit, rounds=ROUNDS)
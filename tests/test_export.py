@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Export tests."""
+
+import csv
+import json
+from datetime import datetime, timezone
+from io import StringIO
+
+from invenio_access.permissions import system_identity
+
+from invenio_faculty_profiles.export import iter_csv, iter_jsonl
+from invenio_faculty_profiles.proxies import current_profiles_service
+
+
+def test_serializers():
+    profiles = [
+        {"id": "a", "metadata": {"family_name": "Doe", "identifiers": [{"x": 1}]}},
+        {"id": "b", "metadata": {"family_name": "Roe, Jr."}},
+    ]
+
+    lines = list(iter_jsonl(profiles))
+    assert [json.loads(line) for line in lines] == profiles
+
+    columns = ["id", "metadata.family_name", "metadata.identifiers", "missing.key"]
+    rows = list(csv.reader(StringIO("".join(iter_csv(profiles, columns)))))
+    assert rows == [
+        columns,
+        ["a", "Doe", '[{"x": 1}]', ""],
+        ["b", "Roe, Jr.", "", ""],
+    ]
+
+
+def test_export(app, db, search_clear, employee_profile_data, admin_client):
+    old = current_profiles_service.create(system_identity, employee_profile_data)
+    since = datetime.now(timezone.utc)
+    new = current_profiles_service.create(system_identity, employee_profile_data)
+    deleted = current_profiles_service.create(system_identity, employee_profile_data)
+    current_profiles_service.delete(system_identity, deleted.id)
+
+    exported = list(current_profiles_service.export(system_identity, batch_size=1))
+    assert sorted(p["id"] for p in exported) == sorted([old.id, new.id])
+    assert "permissions" not in exported[0]
+
+    exported = current_profiles_service.export(system_identity, updated_since=since)
+    assert [p["id"] for p in exported] == [new.id]
+
+    res = admin_client.get(
+        "/faculty-profiles/_export",
+        query_string={
+            "format": "csv",
+            "updated_since": since.isoformat(),
+        },
+    )
+    assert res.status_code == 200
+    assert res.mimetype == "text/csv"
+    rows = list(csv.DictReader(StringIO(res.get_data(as_text=True))))
+    assert [row["id"] for row in rows] == [new.id]
+    assert rows[0]["metadata.family_name"] == "Doe"
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Reindex tests."""
+
+from uuid import UUID
+
+from invenio_access.permissions import system_identity
+from invenio_search import current_search_client
+from invenio_search.utils import build_alias_name
+
+from invenio_faculty_profiles.proxies import current_profiles_service
+from invenio_faculty_profiles.records.api import FacultyProfile
+from invenio_faculty_profiles.reindex import iter_id_batches, reindex
+
+
+def test_iter_id_batches(app, db, search_clear, employee_profile_data):
+    profiles = [
+        current_profiles_service.create(system_identity, employee_profile_data)
+        for _ in range(3)
+    ]
+    ids = sorted(UUID(profile.id) for profile in profiles)
+
+    assert list(iter_id_batches(2)) == [ids[:2], ids[2:]]
+
+
+def test_reindex(app, db, search_clear, employee_profile_data):
+    """Test the reindexing of the faculty profiles into a new index."""
+    for _ in range(3):
+        current_profiles_service.create(system_identity, employee_profile_data)
+    alias = build_alias_name(FacultyProfile.index._name)
+    search_alias = build_alias_name(FacultyProfile.index.search_alias)
+    (old_index,) = current_search_client.indices.get_alias(name=alias)
+
+    new_index, indexed, failed = reindex(workers=1, batch_size=2)
+
+    assert (indexed, failed) == (3, 0)
+    # Both the write and the search aliases are moved
+    assert list(current_search_client.indices.get_alias(name=alias)) == [new_index]
+    assert list(current_search_client.indices.get_alias(name=search_alias)) == [
+        new_index
+    ]
+    assert not current_search_client.indices.exists(index=old_index)
+    assert current_profiles_service.search(system_identity).total == 3
+
+    # Not an index of the mappings, search_clear does not know about it
+    current_search_client.indices.delete(index=new_index)
@@ -1,5 +1,16 @@
+import json
 from copy import deepcopy
 from io import BytesIO
+from urllib.parse import urlsplit
+
+from invenio_access.permissions import system_identity
+from invenio_records_permissions.generators import AnyUser, SystemProcess
+from invenio_search.engine import dsl
+from PIL import Image
+
+from invenio_faculty_profiles.proxies import current_profiles_service
+from invenio_faculty_profiles.records.api import FacultyProfile
+from invenio_faculty_profiles.services.permissions import FacultyProfilePermissionPolicy
 
 
 def test_resource(
@@ -163,6 +174,137 @@ def test_photo_flow(
     assert res.json["message"] == "No file exists for this faculty profile."
 
 
+def test_photo_conditional_get(
+    app,
+    db,
+    users,
+    search_clear,
+    search,
+    employee_profile_data,
+    location,
+    admin_client,
+    headers,
+):
+    """Test HTTP caching of the photo download."""
+    res = admin_client.post("/faculty-profiles", json=employee_profile_data)
+    assert res.status_code == 201
+    id_ = res.json["id"]
+
+    res = admin_client.put(
+        f"/faculty-profiles/{id_}/photo",
+        headers={
+            **headers,
+            "content-type": "application/octet-stream",
+            "X-Filename": "photo.jpg",
+        },
+        data=BytesIO(b"photo"),
+    )
+    assert res.status_code == 200
+    checksum = res.json["checksum"]
+
+    res = admin_client.get(f"/faculty-profiles/{id_}/photo")
+    assert res.status_code == 200
+    assert res.headers["ETag"] == f'"{checksum}"'
+    assert res.headers["Last-Modified"]
+    assert res.cache_control.public
+    assert res.cache_control.max_age == app.config["FACULTY_PROFILES_FILES_MAX_AGE"]
+
+    # Revalidation of an unchanged photo
+    res = admin_client.get(
+        f"/faculty-profiles/{id_}/photo", headers={"If-None-Match": f'"{checksum}"'}
+    )
+    assert res.status_code == 304
+    assert res.data == b""
+
+    # A stale ETag gets the new photo
+    res = admin_client.put(
+        f"/faculty-profiles/{id_}/photo",
+        headers={
+            **headers,
+            "content-type": "application/octet-stream",
+            "X-Filename": "photo.jpg",
+        },
+        data=BytesIO(b"new_photo"),
+    )
+    assert res.status_code == 200
+    res = admin_client.get(
+        f"/faculty-profiles/{id_}/photo", headers={"If-None-Match": f'"{checksum}"'}
+    )
+    assert res.status_code == 200
+    assert res.data == b"new_photo"
+
+
+def test_photo_renditions(
+    app,
+    db,
+    users,
+    search_clear,
+    search,
+    employee_profile_data,
+    location,
+    admin_client,
+    headers,
+):
+    """Test resized photo renditions."""
+    res = admin_client.post("/faculty-profiles", json=employee_profile_data)
+    assert res.status_code == 201
+    id_ = res.json["id"]
+    assert (
+        res.json["links"]["photo_small"]
+        == f"https://127.0.0.1:5000/api/faculty-profiles/{id_}/photo/64"
+    )
+
+    # No photo, no rendition
+    res = admin_client.get(f"/faculty-profiles/{id_}/photo/64")
+    assert res.status_code == 404
+
+    photo = BytesIO()
+    Image.new("RGB", (1024, 768), "red").save(photo, format="PNG")
+    res = admin_client.put(
+        f"/faculty-profiles/{id_}/photo",
+        headers={
+            **headers,
+            "content-type": "application/octet-stream",
+            "X-Filename": "photo.png",
+        },
+        data=BytesIO(photo.getvalue()),
+    )
+    assert res.status_code == 200
+
+    res = admin_client.get(f"/faculty-profiles/{id_}")
+    assert {"photo.png", "photo-64.webp", "photo-128.webp", "photo-512.webp"} == set(
+        res.json["files"]["entries"]
+    )
+
+    # The smallest rendition covering the size is served
+    res = admin_client.get(f"/faculty-profiles/{id_}/photo/100")
+    assert res.status_code == 200
+    assert Image.open(BytesIO(res.data)).size == (128, 96)
+    assert res.cache_control.max_age == app.config["FACULTY_PROFILES_FILES_MAX_AGE"]
+
+    # The original photo is served for sizes above the renditions, or until
+    # they are created, and revalidated
+    res = admin_client.get(f"/faculty-profiles/{id_}/photo/1024")
+    assert res.status_code == 200
+    assert res.data == photo.getvalue()
+    assert res.cache_control.no_cache
+    assert res.cache_control.max_age is None
+
+    # Renditions are deleted with the photo
+    res = admin_client.delete(f"/faculty-profiles/{id_}/photo", headers=headers)
+    assert res.status_code == 204
+    res = admin_client.get(f"/faculty-profiles/{id_}")
+    assert not res.json.get("files", {}).get("entries")
+
+    # A stale attachment naming a missing file is not found
+    record = FacultyProfile.pid.resolve(id_)
+    record["attachments"] = {"photo": "photo.png"}
+    record.commit()
+    db.session.commit()
+    res = admin_client.get(f"/faculty-profiles/{id_}/photo/1024")
+    assert res.status_code == 404
+
+
 def test_cv_flow(
     app,
     db,
@@ -329,6 +471,140 @@ def test_photo_max_content_length(
     assert res.status_code == 200
 
 
+def test_search_cursor_and_scan(
+    app, db, users, headers, search_clear, employee_profile_data, admin_client
+):
+    """Test the search cursor links and the scan endpoint."""
+    for _ in range(3):
+        admin_client.post(
+            "/faculty-profiles", headers=headers, json=employee_profile_data
+        )
+    FacultyProfile.index.refresh()
+
+    res = admin_client.get("/faculty-profiles?size=2&sort=newest")
+    assert res.status_code == 200
+    assert len(res.json["hits"]["hits"]) == 2
+    next_cursor = urlsplit(res.json["links"]["next_cursor"])
+
+    res = admin_client.get("/faculty-profiles", query_string=next_cursor.query)
+    assert res.status_code == 200
+    assert len(res.json["hits"]["hits"]) == 1
+    assert "next_cursor" not in res.json["links"]
+
+    res = admin_client.get("/faculty-profiles?sort=newest&cursor=invalid")
+    assert res.status_code == 400
+
+    res = admin_client.get("/faculty-profiles/_scan")
+    assert res.status_code == 200
+    assert res.mimetype == "application/x-ndjson"
+    lines = res.get_data(as_text=True).splitlines()
+    assert len({json.loads(line)["id"] for line in lines}) == 3
+
+    # Scanning is restricted to administrators
+    with app.test_client() as anonymous_client:
+        res = anonymous_client.get("/faculty-profiles/_scan")
+    assert res.status_code == 403
+
+
+def test_read_batch(
+    app,
+    db,
+    users,
+    headers,
+    search_clear,
+    employee_profile_data,
+    admin_client,
+    monkeypatch,
+):
+    """Test the read of many faculty profiles by their ids."""
+    ids = [
+        admin_client.post(
+            "/faculty-profiles", headers=headers, json=employee_profile_data
+        ).json["id"]
+        for _ in range(3)
+    ]
+    admin_client.delete(f"/faculty-profiles/{ids[2]}", headers=headers)
+
+    res = admin_client.post(
+        "/faculty-profiles/_mget",
+        headers=headers,
+        json={"ids": [ids[1], ids[0], ids[1], ids[2], "not-an-id"]},
+    )
+    assert res.status_code == 200
+    assert [hit["id"] for hit in res.json["hits"]["hits"]] == [ids[1], ids[0]]
+    assert res.json["hits"]["total"] == 2
+    assert res.json["hits"]["hits"][0]["metadata"]["family_name"] == "Doe"
+    assert res.json["hits"]["hits"][0]["links"]["self"].endswith(ids[1])
+    assert res.json["errors"] == [
+        {"id": ids[2], "status": 404},
+        {"id": "not-an-id", "status": 404},
+    ]
+
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_READ_MANY_MAX_IDS", 2)
+    res = admin_client.post(
+        "/faculty-profiles/_mget", headers=headers, json={"ids": ids}
+    )
+    assert res.status_code == 400
+    res = admin_client.post("/faculty-profiles/_mget", headers=headers, json={})
+    assert res.status_code == 400
+
+
+class SmithsOnly(AnyUser):
+    """Let anyone search the profiles of the Smiths only."""
+
+    def query_filter(self, **kwargs):
+        """Filter the profiles of the Smiths."""
+        return dsl.Q("term", **{"metadata.family_name": "Smith"})
+
+
+def test_suggest(
+    app,
+    db,
+    users,
+    headers,
+    search_clear,
+    location,
+    employee_profile_data,
+    admin_client,
+    monkeypatch,
+):
+    """Test the suggestions of faculty profiles."""
+    res = admin_client.post(
+        "/faculty-profiles", headers=headers, json=employee_profile_data
+    )
+    id_ = res.json["id"]
+    data = deepcopy(employee_profile_data)
+    data["metadata"].update(given_names="Jane", family_name="Smith")
+    admin_client.post("/faculty-profiles", headers=headers, json=data)
+    current_profiles_service.update_photo(
+        system_identity, id_, "photo.jpg", BytesIO(b"photo")
+    )
+    FacultyProfile.index.refresh()
+
+    res = admin_client.get("/faculty-profiles/_suggest", query_string={"q": "john d"})
+    assert res.status_code == 200
+    hits = res.json["hits"]["hits"]
+    assert [hit["id"] for hit in hits] == [id_]
+    assert hits[0]["name"] == "John Doe"
+    assert hits[0]["department"] == "Biology"
+    assert hits[0]["links"]["photo_small"].endswith(f"/faculty-profiles/{id_}/photo/64")
+    assert "biography" not in hits[0]
+
+    res = admin_client.get("/faculty-profiles/_suggest", query_string={"q": "smi"})
+    assert [hit["name"] for hit in res.json["hits"]["hits"]] == ["Jane Smith"]
+    assert "photo_small" not in res.json["hits"]["hits"][0]["links"]
+
+    res = admin_client.get("/faculty-profiles/_suggest")
+    assert res.status_code == 400
+
+    # Suggestions are filtered like the search results
+    monkeypatch.setattr(
+        FacultyProfilePermissionPolicy, "can_search", [SmithsOnly(), SystemProcess()]
+    )
+    res = admin_client.get("/faculty-profiles/_suggest", query_string={"q": "j"})
+    assert [hit["name"] for hit in res.json["hits"]["hits"]] == ["Jane Smith"]
+
+
 def test_faculty_profiles_search_config(client):
     """Test community search config."""
     res = client.get("/config/faculty-profiles-search-config")
@@ -348,3 +624,163 @@ def test_faculty_profiles_search_config(client):
         "defaultSortingOnEmptyQueryString",
     ]
     assert data["appId"] == "search"
+
+    # Computed once, revalidated with its strong ETag
+    etag = res.headers["ETag"]
+    assert not res.get_etag()[1]
+    res = client.get(
+        "/config/faculty-profiles-search-config", headers={"If-None-Match": etag}
+    )
+    assert res.status_code == 304
+    assert res.headers["ETag"] == etag
+
+    # Translated in the locale of the request, revalidated on every use
+    assert set(res.vary) == {"Accept-Language", "Cookie"}
+    assert res.cache_control.public
+    assert res.cache_control.no_cache
+
+
+def test_cv_max_content_length(
+    app,
+    db,
+    users,
+    search_clear,
+    search,
+    employee_profile_data,
+    location,
+    admin_client,
+    headers,
+):
+    """Test cv max size."""
+    res = admin_client.post("/faculty-profiles", json=employee_profile_data)
+    assert res.status_code == 201
+    id_ = res.json["id"]
+
+    app.config["FACULTY_PROFILES_CV_MAX_FILE_SIZE"] = 10
+    app.config["FACULTY_PROFILES_UPLOAD_CHUNK_SIZE"] = 4
+
+    # Rejected from the content length
+    res = admin_client.put(
+        f"/faculty-profiles/{id_}/cv",
+        headers={**headers, "content-type": "application/octet-stream"},
+        data=BytesIO(b"cv" * 6),
+    )
+    assert res.status_code == 400
+
+    # Rejected while streaming when no content length is sent
+    res = admin_client.put(
+        f"/faculty-profiles/{id_}/cv",
+        headers={**headers, "content-type": "application/octet-stream"},
+        data=(chunk for chunk in [b"cv" * 3, b"cv" * 3]),
+    )
+    assert res.status_code == 400
+
+    res = admin_client.put(
+        f"/faculty-profiles/{id_}/cv",
+        headers={**headers, "content-type": "application/octet-stream"},
+        data=BytesIO(b"cv"),
+    )
+    assert res.status_code == 200
+
+
+def test_cv_multipart_upload(
+    app,
+    db,
+    users,
+    search_clear,
+    search,
+    employee_profile_data,
+    location,
+    admin_client,
+    headers,
+):
+    """Test resumable cv upload."""
+    res = admin_client.post("/faculty-profiles", json=employee_profile_data)
+    assert res.status_code == 201
+    id_ = res.json["id"]
+
+    res = admin_client.post(
+        f"/faculty-profiles/{id_}/cv/upload",
+        headers=headers,
+        json={"filename": "cv.pdf", "size": 10, "parts": 2, "part_size": 5},
+    )
+    assert res.status_code == 201
+
+    # Parts can be sent in any order and sent again
+    for part, data in [(2, b"fghij"), (1, b"xxxxx"), (1, b"abcde")]:
+        res = admin_client.put(
+            f"/faculty-profiles/{id_}/cv/upload/{part}",
+            headers={**headers, "content-type": "application/octet-stream"},
+            data=BytesIO(data),
+        )
+        assert res.status_code == 200
+
+    # The cv is only available once the upload is completed
+    res = admin_client.get(f"/faculty-profiles/{id_}/cv")
+    assert res.status_code == 404
+
+    res = admin_client.post(f"/faculty-profiles/{id_}/cv/upload/commit")
+    assert res.status_code == 200
+
+    res = admin_client.get(f"/faculty-profiles/{id_}/cv")
+    assert res.status_code == 200
+    assert res.data == b"abcdefghij"
+
+
+def test_remote_file_transfer(
+    app,
+    db,
+    users,
+    search_clear,
+    search,
+    employee_profile_data,
+    location,
+    admin_client,
+    headers,
+    monkeypatch,
+):
+    """Test cv transfer from a remote location."""
+    res = admin_client.post("/faculty-profiles", json=employee_profile_data)
+    assert res.status_code == 201
+    id_ = res.json["id"]
+    body = {
+        "filename": "cv.pdf",
+        "size": 1000,
+        "transfer_type": "R",
+        "url": "https://example.org/cv.pdf",
+    }
+
+    # Only multipart uploads are allowed by default
+    res = admin_client.post(
+        f"/faculty-profiles/{id_}/cv/upload", headers=headers, json=body
+    )
+    assert res.status_code == 400
+
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_FILES_TRANSFER_TYPES", ["M", "R"])
+    monkeypatch.setitem(
+        app.config, "RECORDS_RESOURCES_FILES_ALLOWED_REMOTE_DOMAINS", ["example.org"]
+    )
+    res = admin_client.post(
+        f"/faculty-profiles/{id_}/cv/upload", headers=headers, json=body
+    )
+    assert res.status_code == 201
+
+    # The size is required, and photos cannot be remote files
+    res = admin_client.post(
+        f"/faculty-profiles/{id_}/cv/upload",
+        headers=headers,
+        json={k: v for k, v in body.items() if k != "size"},
+    )
+    assert res.status_code == 400
+    res = admin_client.post(
+        f"/faculty-profiles/{id_}/photo/upload",
+        headers=headers,
+        json={**body, "filename": "photo.jpg"},
+    )
+    assert res.status_code == 400
+
+    # Downloads redirect to the remote file
+    res = admin_client.get(f"/faculty-profiles/{id_}/cv")
+    assert res.status_code == 302
+    assert res.headers["Location"] == "https://example.org/cv.pdf"
+    assert res.cache_control.no_store
@@ -8,12 +8,36 @@
 
 """Service tests."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from io import BytesIO
 
+import pytest
 from invenio_access.permissions import system_identity
+from invenio_cache import current_cache
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
+from invenio_records_resources.services.errors import (
+    PermissionDeniedError,
+    QuerystringValidationError,
+)
+from invenio_records_resources.services.uow import UnitOfWork
+from invenio_search import current_search_client
+from marshmallow import ValidationError
 
 from invenio_faculty_profiles.proxies import current_profiles_service
 from invenio_faculty_profiles.records.api import FacultyProfile
+from invenio_faculty_profiles.records.models import FacultyProfileRecordModel
+from invenio_faculty_profiles.services.cache import (
+    SEARCH_VERSION_KEY,
+    execute_search,
+    invalidate_search_results,
+)
+from invenio_faculty_profiles.services.components import FacultyProfilesRecordComponent
+from invenio_faculty_profiles.services.params import decode_cursor, guard_query
+from invenio_faculty_profiles.services.permissions import check_permissions
+from invenio_faculty_profiles.tasks import attribute_record, process_index_queue
 
 
 def test_service_layer(
@@ -63,3 +87,443 @@ def test_service_layer(
         system_identity, q="metadata.family_name:Barnes"
     )
     assert user_profiles.total == 0
+
+
+def test_import_many(
+    app, db, search_clear, location, employee_profile_data, identity_simple
+):
+    """Test the bulk import of faculty profiles."""
+    # Denied when called, before any entry is read
+    with pytest.raises(PermissionDeniedError):
+        current_profiles_service.import_many(identity_simple, [employee_profile_data])
+
+    invalid_profile_data = deepcopy(employee_profile_data)
+    del invalid_profile_data["metadata"]["family_name"]
+    entries = [employee_profile_data, invalid_profile_data, employee_profile_data]
+
+    results = list(
+        current_profiles_service.import_many(system_identity, entries, chunk_size=2)
+    )
+
+    assert [r["row"] for r in results] == [0, 1, 2]
+    assert results[0]["id"] and not results[0]["errors"]
+    assert results[1]["id"] is None and results[1]["errors"]
+    assert results[2]["id"] and not results[2]["errors"]
+
+    current_profiles_service.indexer.process_bulk_queue()
+    FacultyProfile.index.refresh()
+    assert current_profiles_service.search(system_identity).total == 2
+
+
+def test_read_with_attachments(app, db, search_clear, location, employee_profile_data):
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+    current_profiles_service.update_cv(
+        system_identity, profile.id, "cv.pdf", BytesIO(b"cv")
+    )
+
+    item, permissions, attachments = current_profiles_service.read_with_attachments(
+        system_identity, profile.id, actions=["read", "update"]
+    )
+
+    assert item.id == profile.id
+    assert permissions == {"can_read": True, "can_update": True}
+    assert attachments == {"photo": False, "cv": True}
+
+
+def test_file_slots(app, db, search_clear, location, employee_profile_data):
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+    assert profile.data["attachments"] == {}
+
+    current_profiles_service.update_photo(
+        system_identity, profile.id, "photo.jpg", BytesIO(b"photo")
+    )
+    current_profiles_service.update_photo(
+        system_identity, profile.id, "photo.png", BytesIO(b"photo")
+    )
+    current_profiles_service.update(system_identity, profile.id, employee_profile_data)
+    record = FacultyProfile.pid.resolve(profile.id)
+    assert record["attachments"] == {"photo": "photo.png"}
+    assert "photo.jpg" not in record.files
+
+    # Records without a slots mapping find their files by key
+    del record["attachments"]
+    assert record.attachments.get("photo") == "photo.png"
+    assert record.attachments.get("cv") is None
+
+    current_profiles_service.delete_photo(system_identity, profile.id)
+    record = FacultyProfile.pid.resolve(profile.id)
+    assert record["attachments"] == {}
+    assert "photo.png" not in record.files
+
+
+def test_check_permissions(app, db, search_clear, employee_profile_data, monkeypatch):
+    records = [
+        current_profiles_service.create(system_identity, employee_profile_data)._record
+        for _ in range(2)
+    ]
+    calls = []
+    check_permission = current_profiles_service.check_permission
+    monkeypatch.setattr(
+        current_profiles_service,
+        "check_permission",
+        lambda identity, action, **kwargs: calls.append(action)
+        or check_permission(identity, action, **kwargs),
+    )
+
+    with app.test_request_context():
+        for record in records:
+            permissions = check_permissions(
+                current_profiles_service,
+                system_identity,
+                ("create", "update", "commit_files"),
+                record=record,
+            )
+            assert permissions == {
+                "can_create": True,
+                "can_update": True,
+                "can_commit_files": True,
+            }
+
+    # Only the record dependent action is checked for every record
+    assert calls == ["create", "update", "commit_files", "commit_files"]
+
+
+def test_telephone_normalization(app, db, search_clear, employee_profile_data):
+    data = deepcopy(employee_profile_data)
+    data["metadata"]["telephone"] = "(202) 555-0142"
+    profile = current_profiles_service.create(system_identity, data)
+    assert profile.data["metadata"]["telephone"] == "(202) 555-0142"
+    assert profile.data["metadata"]["telephone_e164"] == "+12025550142"
+
+    data["metadata"]["telephone"] = "555"
+    with pytest.raises(ValidationError):
+        current_profiles_service.create(system_identity, data)
+
+
+def test_attributed_record_query(
+    app, db, search_clear, location, employee_profile_data
+):
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+    record = FacultyProfile.get_record(profile.id)
+
+    query = current_profiles_service._setup_attributed_record_query(record)
+    assert query.to_dict() == {"match_none": {}}
+
+    db.session.add(
+        FacultyProfileRecordModel(profile_id=record.id, record_id="abcd-1234")
+    )
+    db.session.commit()
+
+    query = current_profiles_service._setup_attributed_record_query(record)
+    assert query.to_dict() == {"terms": {"id": ["abcd-1234"]}}
+
+
+def publish_record(db, creators):
+    """Publish and index a record of the given creators, returning its id."""
+    draft = RDMDraft.create({"metadata": {"title": "Record", "creators": creators}})
+    draft.commit()
+    record = RDMRecord.publish(draft)
+    record.register()
+    record.commit()
+    db.session.commit()
+    current_rdm_records_service.indexer.index(record)
+    RDMRecord.index.refresh()
+    return record["id"]
+
+
+def test_records_attribution(
+    app,
+    db,
+    search_clear,
+    location,
+    rdm_records_index,
+    employee_profile_data,
+    monkeypatch,
+):
+    """Test the attribution of published records to faculty profiles."""
+    monkeypatch.setitem(
+        app.config, "FACULTY_PROFILES_RECORDS_ATTRIBUTION_ENABLED", True
+    )
+    record_id = publish_record(
+        db, [{"person_or_org": {"name": "Doe, John", "family_name": "Doe"}}]
+    )
+    other_record_id = publish_record(db, [{"person_or_org": {"name": "Doe, Jo"}}])
+
+    def attributed_records(profile_id):
+        return {
+            attribution.record_id
+            for attribution in FacultyProfileRecordModel.query.filter_by(
+                profile_id=profile_id
+            )
+        }
+
+    # Computed by the task queued when the profile is created
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+    assert attributed_records(profile.id) == {record_id}
+    FacultyProfile.index.refresh()
+
+    # Published records are attributed by the same rule
+    published_record_id = publish_record(
+        db,
+        [
+            {
+                "person_or_org": {
+                    "name": "doe, JOHN",
+                    "family_name": "doe",
+                    "given_name": "JOHN",
+                }
+            }
+        ],
+    )
+    uow = UnitOfWork()
+    component = FacultyProfilesRecordComponent(current_profiles_service)
+    component.uow = uow
+    component.publish(system_identity, record={"id": published_record_id})
+    uow.commit()
+    assert attributed_records(profile.id) == {record_id, published_record_id}
+
+    attribute_record(other_record_id)
+    assert not FacultyProfileRecordModel.query.filter_by(
+        record_id=other_record_id
+    ).count()
+
+
+def test_cursor_pagination(
+    app, db, search_clear, employee_profile_data, identity_simple, monkeypatch
+):
+    """Test the cursor pagination and the scan of faculty profiles."""
+    ids = {
+        current_profiles_service.create(system_identity, employee_profile_data).id
+        for _ in range(3)
+    }
+    FacultyProfile.index.refresh()
+
+    first = current_profiles_service.search(
+        system_identity, params={"size": 2, "sort": "newest"}
+    )
+    assert len(list(first.hits)) == 2
+    assert first.next_cursor
+
+    second = current_profiles_service.search(
+        system_identity,
+        params={"size": 2, "sort": "newest", "cursor": first.next_cursor},
+    )
+    assert second.next_cursor is None
+    assert {hit["id"] for hit in [*first.hits, *second.hits]} == ids
+
+    with pytest.raises(QuerystringValidationError):
+        decode_cursor("oldest", first.next_cursor)
+    with pytest.raises(QuerystringValidationError):
+        decode_cursor("newest", "not-a-cursor")
+
+    scanned = [
+        hit["id"] for hit in current_profiles_service.scan_search(system_identity)
+    ]
+    assert sorted(scanned) == sorted(ids)
+
+    # No point in time is left open by a scan which is never iterated
+    create_pit = current_search_client.create_pit
+    pits = []
+    monkeypatch.setattr(
+        current_search_client,
+        "create_pit",
+        lambda **kwargs: pits.append(kwargs) or create_pit(**kwargs),
+    )
+    current_profiles_service.scan_search(system_identity)
+    assert pits == []
+    with pytest.raises(PermissionDeniedError):
+        current_profiles_service.scan_search(identity_simple)
+
+
+def test_query_cost_guard(app, db, search_clear, employee_profile_data):
+    """Test the rewriting and rejection of costly search queries."""
+    assert guard_query("metadata.family_name:do*") == (
+        "metadata.family_name.suggest:do*"
+    )
+    # Only the wildcard terms of a field move to its subfield
+    assert guard_query("metadata.family_name:(do* OR smith)") == (
+        "metadata.family_name:(metadata.family_name.suggest:do* OR smith)"
+    )
+    assert guard_query("metadata.biography:(eng* OR x)") == (
+        "metadata.biography:(eng* OR x)"
+    )
+    # Queries which are not rewritten are kept as written
+    assert guard_query("doe~ AND john") == "doe~ AND john"
+    assert guard_query("a AND (b OR") == "a AND (b OR"
+
+    for query in [
+        "*mith",
+        "metadata.family_name:?oe",
+        "/do.*/",
+        " OR ".join(["a"] * 65),
+        " ".join(["a*"] * 9),
+    ]:
+        with pytest.raises(QuerystringValidationError):
+            guard_query(query)
+
+    current_profiles_service.create(system_identity, employee_profile_data)
+    FacultyProfile.index.refresh()
+    result = current_profiles_service.search(
+        system_identity, params={"q": "metadata.family_name:(do* OR smith)"}
+    )
+    assert result.total == 1
+    assert "timed_out" not in result.to_dict()
+
+
+def test_search_cache(app, db, search_clear, employee_profile_data, monkeypatch):
+    """Test the sharing of search responses through the cache."""
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_SEARCH_CACHE_TIMEOUT", 60)
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL", 0)
+    current_profiles_service.create(system_identity, employee_profile_data)
+    FacultyProfile.index.refresh()
+
+    requests = []
+    search = current_search_client.search
+    monkeypatch.setattr(
+        current_search_client,
+        "search",
+        lambda *args, **kwargs: requests.append(kwargs) or search(*args, **kwargs),
+    )
+
+    assert current_profiles_service.search(system_identity).total == 1
+    assert current_profiles_service.search(system_identity).total == 1
+    assert len(requests) == 1
+
+    # Different parameters make a different search
+    current_profiles_service.search(system_identity, params={"sort": "newest"})
+    assert len(requests) == 2
+
+    # Dropped once a profile is committed and indexed
+    current_profiles_service.create(system_identity, employee_profile_data)
+    FacultyProfile.index.refresh()
+    assert current_profiles_service.search(system_identity).total == 2
+    assert len(requests) == 3
+
+    # Cached until the profiles indexed are searchable only
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL", 1)
+    invalidate_search_results()
+    current_profiles_service.search(system_identity)
+    current_profiles_service.search(system_identity)
+    assert len(requests) == 4
+    time.sleep(1.1)
+    current_profiles_service.search(system_identity)
+    current_profiles_service.search(system_identity)
+    assert len(requests) == 5
+
+    # A version token created on a cold cache is not waited for
+    monkeypatch.setitem(
+        app.config, "FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL", 60
+    )
+    current_cache.delete(SEARCH_VERSION_KEY)
+    current_profiles_service.search(system_identity)
+    current_profiles_service.search(system_identity)
+    assert len(requests) == 6
+
+
+def test_search_cache_concurrent_misses(
+    app, db, search_clear, employee_profile_data, monkeypatch
+):
+    """Test that identical searches missing the cache together run once."""
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_SEARCH_CACHE_TIMEOUT", 60)
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL", 0)
+    current_profiles_service.create(system_identity, employee_profile_data)
+    FacultyProfile.index.refresh()
+    invalidate_search_results()
+
+    requests = []
+    search = current_search_client.search
+
+    def slow_search(*args, **kwargs):
+        requests.append(kwargs)
+        time.sleep(0.5)
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(current_search_client, "search", slow_search)
+
+    def run_search():
+        with app.app_context():
+            profiles_search = current_profiles_service._search(
+                "search", system_identity, {}, None
+            )
+            return execute_search(profiles_search).hits.total.value
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        totals = list(executor.map(lambda _: run_search(), range(4)))
+    assert totals == [1, 1, 1, 1]
+    assert len(requests) == 1
+
+    # Also while the profiles indexed may not be searchable yet
+    monkeypatch.setitem(
+        app.config, "FACULTY_PROFILES_SEARCH_CACHE_REFRESH_INTERVAL", 60
+    )
+    invalidate_search_results()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        totals = list(executor.map(lambda _: run_search(), range(4)))
+    assert totals == [1, 1, 1, 1]
+    assert len(requests) == 2
+
+
+def test_read_changes(app, db, search_clear, employee_profile_data, monkeypatch):
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_CHANGES_DELAY", 0)
+    first = current_profiles_service.create(system_identity, employee_profile_data)
+    second = current_profiles_service.create(system_identity, employee_profile_data)
+
+    changes = current_profiles_service.read_changes(system_identity).to_dict()
+    assert [(c["id"], c["operation"]) for c in changes["hits"]["hits"]] == [
+        (first.id, "created"),
+        (second.id, "created"),
+    ]
+    since = changes["next_since"]
+
+    current_profiles_service.update(system_identity, first.id, employee_profile_data)
+    third = current_profiles_service.create(system_identity, employee_profile_data)
+    current_profiles_service.delete(system_identity, second.id)
+
+    changes = current_profiles_service.read_changes(
+        system_identity, since=since, size=2
+    )
+    hits = list(changes.hits)
+    assert [(c["id"], c["operation"]) for c in hits] == [
+        (first.id, "updated"),
+        (third.id, "created"),
+    ]
+    assert hits[0]["profile"]["metadata"]["family_name"] == "Doe"
+
+    changes = current_profiles_service.read_changes(
+        system_identity, since=changes.next_since
+    )
+    (tombstone,) = changes.hits
+    assert tombstone["id"] == second.id
+    assert tombstone["operation"] == "deleted"
+    assert "profile" not in tombstone
+
+    empty = current_profiles_service.read_changes(
+        system_identity, since=changes.next_since
+    )
+    assert list(empty.hits) == []
+    assert empty.next_since == changes.next_since
+
+    with pytest.raises(QuerystringValidationError):
+        current_profiles_service.read_changes(system_identity, since="invalid")
+
+
+def test_async_indexing(app, db, search_clear, employee_profile_data, monkeypatch):
+    kept = current_profiles_service.create(system_identity, employee_profile_data)
+    deleted = current_profiles_service.create(system_identity, employee_profile_data)
+
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_ASYNC_INDEXING", True)
+    data = deepcopy(employee_profile_data)
+    data["metadata"]["family_name"] = "Smith"
+    current_profiles_service.update(system_identity, kept.id, employee_profile_data)
+    current_profiles_service.update(system_identity, kept.id, data)
+    current_profiles_service.delete(system_identity, deleted.id)
+
+    FacultyProfile.index.refresh()
+    assert current_profiles_service.search(system_identity).total == 2
+
+    # One action per profile, however many times it was queued
+    assert process_index_queue() == (2, 0)
+    FacultyProfile.index.refresh()
+    hits = list(current_profiles_service.search(system_identity).hits)
+    assert [hit["id"] for hit in hits] == [kept.id]
+    assert hits[0]["metadata"]["family_name"] == "Smith"
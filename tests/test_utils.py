@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Utilities tests."""
+
+from io import StringIO
+
+from invenio_faculty_profiles.utils import (
+    TTLCache,
+    iter_json_entries,
+    normalize_telephone,
+    profile_matches_creator,
+    telephone_region,
+)
+
+
+def test_profile_matches_creator():
+    """Test the attribution rule of records to faculty profiles."""
+    metadata = {
+        "family_name": "Doe",
+        "given_names": "John",
+        "identifiers": [{"identifier": "0000-0002-1825-0097"}],
+    }
+
+    assert profile_matches_creator(metadata, {"name": "doe,  JOHN"})
+    assert profile_matches_creator(
+        metadata, {"family_name": "Doe", "given_name": "John"}
+    )
+    assert profile_matches_creator(
+        metadata,
+        {"name": "Roe, Jane", "identifiers": [{"identifier": "0000-0002-1825-0097"}]},
+    )
+    assert not profile_matches_creator(metadata, {"name": "Doe, John Paul"})
+    assert not profile_matches_creator(metadata, {"name": "Doe"})
+    assert not profile_matches_creator({}, {"name": ", "})
+
+
+def test_iter_json_entries():
+    array = StringIO('[{"a": 1}, {"b": [1, 2]},\n{"c": "]"}]')
+    assert list(iter_json_entries(array, read_size=4)) == [
+        {"a": 1},
+        {"b": [1, 2]},
+        {"c": "]"},
+    ]
+
+    lines = StringIO('{"a": 1}\n{"b": 2}\n')
+    assert list(iter_json_entries(lines, read_size=4)) == [{"a": 1}, {"b": 2}]
+
+
+def test_ttl_cache():
+    cache = TTLCache()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("en", factory, ttl=60) == 1
+    assert cache.get("en", factory, ttl=60) == 1
+    # Expired entries are computed again
+    assert cache.get("de", factory, ttl=0) == 2
+    assert cache.get("de", factory, ttl=0) == 3
+
+    cache.clear()
+    assert cache.get("en", factory, ttl=60) == 4
+
+
+def test_normalize_telephone():
+    assert normalize_telephone("(202) 555-0142", "US") == "+12025550142"
+    assert normalize_telephone("020 7946 0958", "GB") == "+442079460958"
+    assert normalize_telephone("+44 20 7946 0958", "US") == "+442079460958"
+    assert normalize_telephone("not a number", "US") is None
+    assert normalize_telephone("123", "US") is None
+
+
+def test_telephone_region(app):
+    with app.test_request_context():
+        assert telephone_region() == "US"
+        app.config["FACULTY_PROFILES_TELEPHONE_REGION"] = "GB"
+        assert telephone_region() == "GB"
+        app.config["FACULTY_PROFILES_TELEPHONE_REGION"] = None
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 Ubiquity Press.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""UI views tests."""
+
+from copy import deepcopy
+from io import BytesIO
+
+from flask import g
+from flask_login import login_user
+from invenio_access.permissions import system_identity
+
+from invenio_faculty_profiles.proxies import current_profiles_service
+from invenio_faculty_profiles.views.decorators import cached_profile_page
+from invenio_faculty_profiles.views.ui import faculty_profile_has_photo
+
+
+def test_faculty_profile_has_photo(
+    app, db, search_clear, location, employee_profile_data
+):
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+
+    # Decided from the serialized files entries
+    assert not faculty_profile_has_photo(profile)
+    assert not faculty_profile_has_photo(profile.to_dict())
+
+    current_profiles_service.update_photo(
+        system_identity, profile.id, "photo.jpg", BytesIO(b"photo")
+    )
+    profile = current_profiles_service.read(system_identity, profile.id)
+    assert faculty_profile_has_photo(profile)
+
+    # Looked up once per request when only the id is known
+    with app.test_request_context():
+        g.identity = system_identity
+        assert faculty_profile_has_photo(profile.id)
+        assert g.faculty_profiles_has_photo == {profile.id: True}
+
+
+def test_cached_profile_page(
+    app, db, search_clear, users, employee_profile_data, monkeypatch
+):
+    monkeypatch.setitem(app.config, "FACULTY_PROFILES_PAGE_CACHE_TIMEOUT", 60)
+    profile = current_profiles_service.create(system_identity, employee_profile_data)
+    renders = []
+
+    @cached_profile_page
+    def page(pid_value):
+        renders.append(pid_value)
+        return f"page {len(renders)}"
+
+    with app.test_request_context():
+        assert page(pid_value=profile.id) == "page 1"
+        assert page(pid_value=profile.id) == "page 1"
+
+        # Dropped once the change is committed
+        data = deepcopy(employee_profile_data)
+        data["metadata"]["family_name"] = "Smith"
+        current_profiles_service.update(system_identity, profile.id, data)
+        assert page(pid_value=profile.id) == "page 2"
+        assert page(pid_value=profile.id) == "page 2"
+
+    # Not cached for authenticated users
+    with app.test_request_context():
+        login_user(users[0].user)
+        assert page(pid_value=profile.id) == "page 3"
+        assert page(pid_value=profile.id) == "page 4"